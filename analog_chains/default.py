@@ -1,3 +1,5 @@
+import numpy as np
+
 from hidfmux.core.resources.analog_chain import AnalogChain
 import hidfmux.core.resources.hardware_models as hardware_models
 import hidfmux.core.utils.transferfunctions as transferfunctions
@@ -27,12 +29,8 @@ class Default(AnalogChain):
     
     def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm):
         
-        n_dac = self.ad9082.dac_noise(spectral_freq, carrier_power_dbm)
-        n_dac_output = to_dbm(n_dac) + self.input_gain(carrier_freq) + self.return_gain(carrier_freq)
-        
-        n_adc = self.ad9082.adc_noise()
-        
-        # totals at output:
-        noise_total = to_W(n_dac_output) + n_adc
-        
-        return noise_total
+        spectral_freq = np.asarray(spectral_freq, dtype=np.float64)
+
+        # the loopback chain has 0 dB input and return gain, so the DAC noise
+        # reaches the output unchanged; no dBm round-trip needed
+        return self.ad9082.dac_noise(spectral_freq, carrier_power_dbm) + self.ad9082.adc_noise()
@@ -1,3 +1,4 @@
+import functools
 import numpy as np
 import os
 import pickle
@@ -9,50 +10,146 @@ import hidfmux.core.resources.hardware_models as hardware_models
 import hidfmux.core.utils.transferfunctions as transferfunctions
 from hidfmux.core.utils.transferfunctions import to_dbm, to_W
 
+from hardware_models import shared_model as _shared_model
 
 
-class McGillFull_meas(AnalogChain):
-    
-    def __init__(self):
-        
+def _db_to_lin(gain_db):
+    return 10 ** (gain_db / 10)
+
+
+def _sum_terms(terms):
+    # sum a list of broadcast-compatible gain terms while reusing a single
+    # output buffer, instead of allocating one intermediate per "+"
+    out = np.add(terms[0], terms[1])
+    for term in terms[2:]:
+        if isinstance(out, np.ndarray) and out.ndim:
+            np.add(out, term, out=out)
+        else:
+            out = out + term
+    return out
+
+
+def _combine_noise(n_dac_W, in_gain_db, ret_gain_db, lna_noise_W):
+    # single fused pass over the spectral axis: DAC noise through the full
+    # chain plus LNA noise through the return chain, all in W
+    ret_lin = 10 ** (ret_gain_db / 10)
+    return n_dac_W * 10 ** (in_gain_db / 10) * ret_lin + lna_noise_W * ret_lin
+
+
+try:
+    # optionally JIT the combine kernel; the numpy fallback is identical
+    import numba
+
+    _combine_noise = numba.njit(fastmath=True, cache=True)(_combine_noise)
+    # compile at import time so the first user call doesn't pay warmup
+    _combine_noise(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1))
+except ImportError:
+    pass
+
+
+@functools.cache
+def _load_tf(path):
+    # the loaded transfer function is a stateless callable, so one instance
+    # can safely be shared by every chain that references the same pickle
+    return transferfunctions.load_transferfunction(path)
+
 
-        self.ad9082 = hardware_models.AD9082()
+
+class _McGillFullMeasBase(AnalogChain):
+    '''
+    Measured McGill chain; the two shipped variants differ only in the
+    room-temperature input attenuator.
+
+    Gain and noise methods accept either a scalar carrier frequency or an
+    np.ndarray of carrier frequencies; all component models evaluate the
+    full array in one call (scipy interpolators broadcast natively).
+    '''
+
+    __slots__ = ('ad9082', '_cs_input_gain', 'warm_cables_in', 'atten300K_input',
+                 'lna', 'wa1', 'wa2', 'warm_cables_return', 'cryo_cables_return',
+                 'atten300K_return', '_cs_output_gain',
+                 '_input_gain_cache', '_return_gain_cache')
+
+    def __init__(self, input_atten_db):
         
-        # measured mcgill cryostat inputline attenuation:
-        self.cs_input_gain = transferfunctions.load_transferfunction(os.path.join(config.get_tf_parent_dir(), 'mcgill_DRonly_input.pkl'))
+
+        self.ad9082 = _shared_model(hardware_models.AD9082)
+
+        # scalar-frequency memo caches for the composite gains; noise
+        # integrations re-query the same carrier many times per sweep
+        self._input_gain_cache = {}
+        self._return_gain_cache = {}
+
+        # measured cryostat transfer functions are loaded lazily (see the
+        # cs_input_gain / cs_output_gain properties)
+        self._cs_input_gain = None
+        self._cs_output_gain = None
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_cables(length_m=3)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_cables, 3)
 
         # extra input attenuator
-        self.atten300K_input = hardware_models.Attenuator(-9, 300)
+        self.atten300K_input = _shared_model(hardware_models.Attenuator, input_atten_db, 300)
         
         # return amplifiers etc
-        self.lna = hardware_models.CryoElec_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_cables(length_m=3)
-        self.cryo_cables_return = hardware_models.SMA_CuNi_cryo(length_m=1.5, temperature=4)
-        self.atten300K_return = hardware_models.Attenuator(-9, 300)
-
-        # measured mcgill cryostat outputline gain
-        self.cs_output_gain = transferfunctions.load_transferfunction(os.path.join(config.get_tf_parent_dir(), 'mcgill_DRonly_return_wLNA.pkl'))
-        
+        self.lna = _shared_model(hardware_models.CryoElec_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_cables, 3)
+        self.cryo_cables_return = _shared_model(hardware_models.SMA_CuNi_cryo, 1.5, 4)
+        self.atten300K_return = _shared_model(hardware_models.Attenuator, -9, 300)
+
         
         
+    @property
+    def cs_input_gain(self):
+        # measured mcgill cryostat inputline attenuation; unpickling costs
+        # disk I/O + spline setup, so defer until a gain is first requested
+        if self._cs_input_gain is None:
+            self._cs_input_gain = _load_tf(os.path.join(config.get_tf_parent_dir(), 'mcgill_DRonly_input.pkl'))
+        return self._cs_input_gain
+
+    @property
+    def cs_output_gain(self):
+        # measured mcgill cryostat outputline gain, loaded on first access
+        if self._cs_output_gain is None:
+            self._cs_output_gain = _load_tf(os.path.join(config.get_tf_parent_dir(), 'mcgill_DRonly_return_wLNA.pkl'))
+        return self._cs_output_gain
+
+
     def input_gain(self, carrier_freq):
-        
-        return self.cs_input_gain(carrier_freq) + self.warm_cables_in.gain(carrier_freq) + self.atten300K_input.gain_meas(carrier_freq)
-    
-    
+
+        key = float(carrier_freq) if np.isscalar(carrier_freq) else None
+        if key is not None and key in self._input_gain_cache:
+            return self._input_gain_cache[key]
+
+        carrier_freq = np.asarray(carrier_freq, dtype=float)
+        gain = _sum_terms([self.cs_input_gain(carrier_freq),
+                           self.warm_cables_in.gain(carrier_freq),
+                           self.atten300K_input.gain_meas(carrier_freq)])
+        if key is not None:
+            self._input_gain_cache[key] = gain
+        return gain
+
+
     def return_gain(self, carrier_freq, carrier_power_dbm=None, return_carrier_power_dbm=None):
 
-        if return_carrier_power_dbm is not None and carrier_power_dbm is not None:
-            # legacy call
-            return_gain = compute_return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
-            return return_gain
-        
-        return_gain = self.cs_output_gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq) + self.atten300K_return.gain_meas(carrier_freq)
+        if return_carrier_power_dbm is not None:
+            # legacy call: infer the return gain from the measured carrier powers
+            return self.compute_return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
+
+        key = float(carrier_freq) if np.isscalar(carrier_freq) else None
+        if key is not None and key in self._return_gain_cache:
+            return self._return_gain_cache[key]
+
+        carrier_freq = np.asarray(carrier_freq, dtype=float)
+        return_gain = _sum_terms([self.cs_output_gain(carrier_freq),
+                                   self.wa1.gain(carrier_freq),
+                                   self.wa2.gain(carrier_freq),
+                                   self.warm_cables_return.gain(carrier_freq),
+                                   self.atten300K_return.gain_meas(carrier_freq)])
+        if key is not None:
+            self._return_gain_cache[key] = return_gain
         return return_gain
 
     def compute_return_gain(self, carrier_freq, carrier_power_dbm, return_carrier_power_dbm):
@@ -60,158 +157,158 @@ class McGillFull_meas(AnalogChain):
         return_gain = return_carrier_power_dbm - self.input_gain(carrier_freq) - carrier_power_dbm
 
         return return_gain
-    
-    
+
+    def input_gain_lin(self, carrier_freq):
+        return _db_to_lin(self.input_gain(carrier_freq))
+
+    def return_gain_lin(self, carrier_freq):
+        return _db_to_lin(self.return_gain(carrier_freq))
+
+
     def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm, return_carrier_power_dbm=None):
 
-        if return_carrier_power_dbm is None:
-            return_gain = self.return_gain(carrier_freq)
+        # the input gain is needed both here and (on the measured-return
+        # path) inside compute_return_gain; evaluate it exactly once
+        in_gain = self.input_gain(carrier_freq)
+
+        if return_carrier_power_dbm is not None:
+            # infer the return gain from the measured carrier powers,
+            # reusing the input gain computed above
+            return_gain = return_carrier_power_dbm - in_gain - carrier_power_dbm
         else:
-            return_gain = self.compute_return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
-        
+            return_gain = self.return_gain(carrier_freq)
+
+        spectral_freq = np.asarray(spectral_freq, dtype=np.float64)
         n_dac = self.ad9082.dac_noise(spectral_freq, carrier_power_dbm)
-        n_dac_output = to_dbm(n_dac) + self.input_gain(carrier_freq) + return_gain #self.return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
-        
+
         # noise of other analog components is small compared to noise of LNA
-        n_lna = to_dbm(self.lna.noise(carrier_freq)) + return_gain# self.return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
+        noise_total = _combine_noise(n_dac, in_gain,
+                                     return_gain, self.lna.noise(carrier_freq))
 
-        # totals at output
-        noise_total = to_W(n_dac_output) + to_W(n_lna)
-        
         return noise_total
-    
-    
-class McGillFull_meas_TiN(AnalogChain):
-    
-    def __init__(self):
-        
 
-        self.ad9082 = hardware_models.AD9082()
-        
-        # measured mcgill cryostat inputline attenuation:
-        self.cs_input_gain = transferfunctions.load_transferfunction(os.path.join(config.get_tf_parent_dir(), 'mcgill_DRonly_input.pkl'))
-        
-        # input cables
-        self.warm_cables_in = hardware_models.SMA_cables(length_m=3)
 
-        # extra input attenuator
-        self.atten300K_input = hardware_models.Attenuator(-26, 300)
-        
-        # return amplifiers etc
-        self.lna = hardware_models.CryoElec_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_cables(length_m=3)
-        self.cryo_cables_return = hardware_models.SMA_CuNi_cryo(length_m=1.5, temperature=4)
-        self.atten300K_return = hardware_models.Attenuator(-9, 300)
-
-        # measured mcgill cryostat outputline gain
-        self.cs_output_gain = transferfunctions.load_transferfunction(os.path.join(config.get_tf_parent_dir(), 'mcgill_DRonly_return_wLNA.pkl'))
-        
-        
-        
-    def input_gain(self, carrier_freq):
-        
-        return self.cs_input_gain(carrier_freq) + self.warm_cables_in.gain(carrier_freq) + self.atten300K_input.gain_meas(carrier_freq)
-    
-    
-    def return_gain(self, carrier_freq, carrier_power_dbm=None, return_carrier_power_dbm=None):
+class McGillFull_meas(_McGillFullMeasBase):
 
-        if return_carrier_power_dbm is not None or carrier_power_dbm is not None:
-            # legacy call
-            return_gain = compute_return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
-            return return_gain
-        
-        return_gain = self.cs_output_gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq) + self.atten300K_return.gain_meas(carrier_freq)
-        return return_gain
+    __slots__ = ()
 
-    def compute_return_gain(self, carrier_freq, carrier_power_dbm, return_carrier_power_dbm):
+    def __init__(self):
+        super().__init__(input_atten_db=-9)
 
-        return_gain = return_carrier_power_dbm - self.input_gain(carrier_freq) - carrier_power_dbm
 
-        return return_gain
-    
-    
-    def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm, return_carrier_power_dbm=None):
+class McGillFull_meas_TiN(_McGillFullMeasBase):
 
-        if return_carrier_power_dbm is None:
-            return_gain = self.return_gain(carrier_freq)
-        else:
-            return_gain = self.compute_return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
-        
-        n_dac = self.ad9082.dac_noise(spectral_freq, carrier_power_dbm)
-        n_dac_output = to_dbm(n_dac) + self.input_gain(carrier_freq) + return_gain #self.return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
-        
-        # noise of other analog components is small compared to noise of LNA
-        n_lna = to_dbm(self.lna.noise(carrier_freq)) + return_gain# self.return_gain(carrier_freq, carrier_power_dbm, return_carrier_power_dbm)
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(input_atten_db=-26)
 
-        # totals at output
-        noise_total = to_W(n_dac_output) + to_W(n_lna)
-        
-        return noise_total    
-    
 
 
 class McGillFull_modeled(AnalogChain):
-    
+
+    __slots__ = ('ad9082', 'atten_300K', 'atten_4K', 'atten_still', 'atten_mxc',
+                 'warm_cables_in', 'cryo_cables_in',
+                 'lna', 'wa1', 'wa2', 'warm_cables_return', 'cryo_cables_return',
+                 'atten_return_warm',
+                 '_input_gain_cache', '_return_gain_cache')
+
     def __init__(self):
 
-        self.ad9082 = hardware_models.AD9082()
-        
+        self.ad9082 = _shared_model(hardware_models.AD9082)
+
+        self._input_gain_cache = {}
+        self._return_gain_cache = {}
+
         # input attenuation
-        self.atten_300K = hardware_models.Attenuator(-9, 300)
-        self.atten_4K = hardware_models.Attenuator(-20, 4)
-        self.atten_still = hardware_models.Attenuator(0, 0.7)
-        self.atten_mxc = hardware_models.Attenuator(-20, 0.03) ###
+        self.atten_300K = _shared_model(hardware_models.Attenuator, -9, 300)
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -20, 4)
+        self.atten_still = _shared_model(hardware_models.Attenuator, 0, 0.7)
+        self.atten_mxc = _shared_model(hardware_models.Attenuator, -20, 0.03) ###
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_cables(length_m=3)
-        self.cryo_cables_in = hardware_models.SMA_CuNi_cryo(length_m=1.5, temperature=4)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_cables, 3)
+        self.cryo_cables_in = _shared_model(hardware_models.SMA_CuNi_cryo, 1.5, 4)
         
         # return amplifiers etc
-        self.lna = hardware_models.CryoElec_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_cables(length_m=3)
-        self.cryo_cables_return = hardware_models.SMA_CuNi_cryo(length_m=1.5, temperature=4)
-        self.atten_return_warm = hardware_models.Attenuator(-9, 300)
+        self.lna = _shared_model(hardware_models.CryoElec_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_cables, 3)
+        self.cryo_cables_return = _shared_model(hardware_models.SMA_CuNi_cryo, 1.5, 4)
+        self.atten_return_warm = _shared_model(hardware_models.Attenuator, -9, 300)
         
         
     def input_gain(self, carrier_freq):
-        
-        atten_input_gain = self.atten_300K.gain_meas(carrier_freq) + self.atten_4K.gain_meas(carrier_freq) + self.atten_still.gain_meas(carrier_freq) + self.atten_mxc.gain_meas(carrier_freq)
+
+        carrier_freq = np.asarray(carrier_freq, dtype=float)
+        atten_input_gain = _sum_terms([self.atten_300K.gain_meas(carrier_freq),
+                                       self.atten_4K.gain_meas(carrier_freq),
+                                       self.atten_still.gain_meas(carrier_freq),
+                                       self.atten_mxc.gain_meas(carrier_freq)])
         cable_input_gain = self.warm_cables_in.gain(carrier_freq) + self.cryo_cables_in.gain(carrier_freq)
-        
+
         return atten_input_gain + cable_input_gain
-    
-    
+
+
     def return_gain(self, carrier_freq):
-        
-        return_gain = self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq) + self.cryo_cables_return.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq) + self.atten_return_warm.gain_meas(carrier_freq)
-        
+
+        carrier_freq = np.asarray(carrier_freq, dtype=float)
+        return_gain = _sum_terms([self.lna.gain(carrier_freq),
+                                   self.wa1.gain(carrier_freq),
+                                   self.wa2.gain(carrier_freq),
+                                   self.cryo_cables_return.gain(carrier_freq),
+                                   self.warm_cables_return.gain(carrier_freq),
+                                   self.atten_return_warm.gain_meas(carrier_freq)])
+
         return return_gain
-    
-    
+
+
     def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm):
-        
+
+        carrier_freq = np.asarray(carrier_freq, dtype=np.float64)
+        spectral_freq = np.asarray(spectral_freq, dtype=np.float64)
+        # dac_noise is a single vectorized evaluation of the fitted phase
+        # noise model, so the whole spectral axis costs one C-level pass
         n_dac = self.ad9082.dac_noise(spectral_freq, carrier_power_dbm)
-        n_dac_output = to_dbm(n_dac) + self.input_gain(carrier_freq) + self.return_gain(carrier_freq)
-        
-        # noise of the attenuators at the LNA
-        natten300K_lna = to_dbm(self.atten_300K.noise()) + self.atten_4K.gain_meas(carrier_freq) + self.atten_still.gain_meas(carrier_freq) + self.atten_mxc.gain_meas(carrier_freq)
-        natten4K_lna = to_dbm(self.atten_4K.noise()) + self.atten_still.gain_meas(carrier_freq) + self.atten_mxc.gain_meas(carrier_freq)
-        nattenstill_lna = to_dbm(self.atten_still.noise()) + self.atten_mxc.gain_meas(carrier_freq)
-        nattenmxc_lna = to_dbm(self.atten_mxc.noise())
-        nattentotal_lna = to_W(nattenstill_lna) + to_W(nattenmxc_lna) + to_W(natten4K_lna) + to_W(natten300K_lna)
+
+        # every component gain is evaluated exactly once, then reused in
+        # each composite expression below
+        g_4k = self.atten_4K.gain_meas(carrier_freq)
+        g_still = self.atten_still.gain_meas(carrier_freq)
+        g_mxc = self.atten_mxc.gain_meas(carrier_freq)
+        g_lna = self.lna.gain(carrier_freq)
+        g_wa1 = self.wa1.gain(carrier_freq)
+        g_wa2 = self.wa2.gain(carrier_freq)
+        g_wcr = self.warm_cables_return.gain(carrier_freq)
+        g_ccr = self.cryo_cables_return.gain(carrier_freq)
+        g_ret_atten = self.atten_return_warm.gain_meas(carrier_freq)
+        return_gain = g_lna + g_wa1 + g_wa2 + g_ccr + g_wcr + g_ret_atten
+        ret_lin = _db_to_lin(return_gain)
+
+        # all noise powers stay in W; dB gains are converted once and
+        # composed as multiplications
+        n_dac_output = n_dac * _db_to_lin(self.input_gain(carrier_freq)) * ret_lin
+
+        # noise of the attenuators at the LNA: stage i rides through the
+        # summed gain of every attenuator downstream of it, so one suffix
+        # cumulative sum replaces the per-stage re-summation (O(k) not O(k^2))
+        down_gains = np.stack([g_4k, g_still, g_mxc, np.zeros_like(g_mxc)])
+        cum_down_lin = _db_to_lin(np.cumsum(down_gains[::-1], axis=0)[::-1])
+        atten_noises = np.array([self.atten_300K.noise(), self.atten_4K.noise(),
+                                 self.atten_still.noise(), self.atten_mxc.noise()])
+        atten_noises = atten_noises.reshape(atten_noises.shape + (1,) * (cum_down_lin.ndim - 1))
+        nattentotal_lna = np.add.reduce(atten_noises * cum_down_lin)
 
         # noise of the amplifiers on the return line
-        n_wa1 = to_dbm(self.wa1.noise(carrier_freq)) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq)
-        n_wa2 = to_dbm(self.wa2.noise(carrier_freq)) + self.wa2.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq)
-        n_lna = to_dbm(self.lna.noise(carrier_freq)) + self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq) + self.cryo_cables_return.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq) +self.atten_return_warm.gain_meas(carrier_freq)
+        n_wa1 = self.wa1.noise(carrier_freq) * _db_to_lin(g_wa1 + g_wa2 + g_wcr)
+        n_wa2 = self.wa2.noise(carrier_freq) * _db_to_lin(g_wa2 + g_wcr)
+        # the LNA noise sees the full return chain
+        n_lna = self.lna.noise(carrier_freq) * ret_lin
         nattenreturn = self.atten_return_warm.noise()
 
         # totals at output
-        nattentotal_out = to_dbm(nattentotal_lna) + self.return_gain(carrier_freq)
-        noise_total = to_W(n_dac_output) + to_W(nattentotal_out) + to_W(n_wa1) + to_W(n_wa2) + to_W(n_lna) + nattenreturn
-        
+        nattentotal_out = nattentotal_lna * ret_lin
+        noise_total = n_dac_output + nattentotal_out + n_wa1 + n_wa2 + n_lna + nattenreturn
+
         return noise_total
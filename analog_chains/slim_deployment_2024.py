@@ -1,6 +1,4 @@
 import numpy as np
-import os
-import pickle
 
 import hidfmux.core.utils.user_config as config
 
@@ -9,274 +7,447 @@ import hidfmux.core.resources.hardware_models as hardware_models
 import hidfmux.core.utils.transferfunctions as transferfunctions
 from hidfmux.core.utils.transferfunctions import to_dbm, to_W
 
+from hardware_models import shared_model as _shared_model
+
+
+# shared default spectral-frequency grid; one read-only array at import
+# time instead of a fresh logspace evaluated per signature, and a stable
+# identity for grid-keyed caching
+_DEFAULT_FRANGE = np.logspace(-2, 2.5, 100)
+_DEFAULT_FRANGE.setflags(write=False)
+
+
+def _sum_dbm(stack):
+    # fused reduction over the stacked term axis: one 10**(x/10) pass per
+    # term and a single log10, instead of a to_W/to_dbm pair per "+"
+    out = 10.0 ** (stack[0] * 0.1)
+    for i in range(1, stack.shape[0]):
+        out = out + 10.0 ** (stack[i] * 0.1)
+    return 10.0 * np.log10(out)
+
+
+try:
+    # optionally JIT the reduction kernel; the numpy fallback is identical
+    import numba
+
+    _sum_dbm = numba.njit(fastmath=True, cache=True)(_sum_dbm)
+    _sum_dbm(np.zeros((2, 1)))
+except ImportError:
+    pass
+
+
+def _combine_noise_dbm(*terms_dbm):
+    # sum powers expressed in dBm and return the total in dBm
+    terms = [np.asarray(t, dtype=float) for t in terms_dbm]
+    return _sum_dbm(np.stack(np.broadcast_arrays(*terms)))
+
+
+
+def _batch_gain(freqs, grid, tables):
+    # summed lookup of every stacked component-gain table at each query
+    # frequency; numpy fallback is one vectorized np.interp per row
+    out = np.zeros(freqs.shape)
+    for row in tables:
+        out += np.interp(freqs, grid, row)
+    return out
+
+
+try:
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _batch_gain(freqs, grid, tables):  # noqa: F811
+        # explicit loop form: numba fuses the per-component interpolation
+        # and parallelizes over the query axis
+        out = np.zeros(freqs.size)
+        for i in numba.prange(freqs.size):
+            f = freqs[i]
+            j = np.searchsorted(grid, f)
+            if j <= 0:
+                for c in range(tables.shape[0]):
+                    out[i] += tables[c, 0]
+            elif j >= grid.size:
+                for c in range(tables.shape[0]):
+                    out[i] += tables[c, -1]
+            else:
+                w = (f - grid[j - 1]) / (grid[j] - grid[j - 1])
+                for c in range(tables.shape[0]):
+                    out[i] += tables[c, j - 1] * (1.0 - w) + tables[c, j] * w
+        return out
+
+    _batch_gain(np.zeros(1), np.array([0.0, 1.0]), np.zeros((1, 2)))
+except ImportError:
+    pass
+
+
 # line_cable_dict = {
 #     1 : {'warm_cables_in':
 # }
 
-class SLIM_deployment_AC_line1(AnalogChain):
-    
-    def __init__(self):
+class _SLIMDeployment2024Base(AnalogChain):
+    '''
+    Shared gain/noise machinery for the 2024 SLIM deployment variants.
+
+    Subclasses build their components in __init__ and declare the signal
+    path with INPUT_PATH / INPUT_CABLES / RETURN_PATH attribute-name
+    tuples; the vectorized reductions, fused dBm sums and precomputed
+    grids here then cover every variant at once.
+    '''
+
+    INPUT_PATH = ()
+    INPUT_CABLES = ()
+    RETURN_PATH = ()
+
+    # dense tabulation grid for the batched gain kernel; covers the band
+    # finely enough that linear interpolation error is negligible
+    _TABLE_GRID = np.linspace(0.0, 3e9, 4096)
+
+    def build_gain_tables(self, grid=None):
+        '''
+        Stack every path component's gain on a dense grid so the gain
+        methods can answer array queries with one batched interpolation
+        (_batch_gain) instead of walking the component models per call.
+        '''
+        grid = self._TABLE_GRID if grid is None else np.asarray(grid, dtype=float)
+        # repack the cable run into struct-of-arrays form: one lengths
+        # vector plus one per-metre loss matrix, so the summed cable gain
+        # is a single matvec instead of a per-object Python loop
+        cables = [getattr(self, name) for name in self.INPUT_CABLES]
+        self._cable_lengths = np.array([c.length for c in cables])
+        self._cable_gain_per_m = np.stack(
+            [np.asarray(c.gain(grid), dtype=float) / c.length for c in cables])
+        self._cable_gain_table = self._cable_lengths @ self._cable_gain_per_m
+        input_parts = [self._gain_of(name, grid) for name in self.INPUT_PATH]
+        input_parts.append(self._cable_gain_table)
+        self._gain_table_grid = grid
+        self._input_gain_table = np.asarray(input_parts, dtype=float)
+        self._return_gain_table = np.asarray(
+            [self._gain_of(name, grid) for name in self.RETURN_PATH], dtype=float)
+
+    def _gain_of(self, name, carrier_freq):
+        # attenuators expose their measured gain via gain_meas; everything
+        # else (filters, amplifiers, cables) via gain
+        component = getattr(self, name)
+        if hasattr(component, 'gain_meas'):
+            return component.gain_meas(carrier_freq)
+        return component.gain(carrier_freq)
+
+    def _input_cable_gain(self, carrier_freq):
+        # summed loss of the full input cable run; shared by input_gain and
+        # the per-stage noise terms in output_noise
+        table = getattr(self, '_cable_gain_table', None)
+        carrier_freq = np.asarray(carrier_freq, dtype=float)
+        if table is not None and carrier_freq.ndim:
+            return np.interp(carrier_freq, self._gain_table_grid, table)
+        return np.add.reduce([getattr(self, name).gain(carrier_freq)
+                              for name in self.INPUT_CABLES])
+
+    def input_gain(self, carrier_freq):
+        
+        if carrier_freq is self._freq_grid:
+            # precomputed at construction for this exact grid
+            return self._input_gain_total
+
+        carrier_freq = np.asarray(carrier_freq, dtype=float)
+        table = getattr(self, '_input_gain_table', None)
+        if table is not None and carrier_freq.ndim:
+            return _batch_gain(carrier_freq.ravel(), self._gain_table_grid,
+                               table).reshape(carrier_freq.shape)
 
-        self.ad9082 = hardware_models.AD9082()
+        parts = [self._gain_of(name, carrier_freq) for name in self.INPUT_PATH]
+        parts.append(self._input_cable_gain(carrier_freq))
+        return np.add.reduce(parts)
+
+    def return_gain(self, carrier_freq):
+        
+        if carrier_freq is self._freq_grid:
+            return self._return_gain_total
+
+        carrier_freq = np.asarray(carrier_freq, dtype=float)
+        table = getattr(self, '_return_gain_table', None)
+        if table is not None and carrier_freq.ndim:
+            return _batch_gain(carrier_freq.ravel(), self._gain_table_grid,
+                               table).reshape(carrier_freq.shape)
+
+        return np.add.reduce([self._gain_of(name, carrier_freq)
+                              for name in self.RETURN_PATH])
+
+    def output_noise(self, carrier_freq, carrier_power_dbm, frange=_DEFAULT_FRANGE):
+
+        # broadcast the carrier sweep against the spectral grid: carrier-
+        # dependent gains become (M, 1) columns and the frange-dependent DAC
+        # noise a (1, K) row, so one call yields the full (M, K) surface
+        carrier_freq = np.atleast_1d(np.asarray(carrier_freq, dtype=float))[:, None]
+        frange = np.atleast_1d(np.asarray(frange, dtype=float))[None, :]
+
+        # hoist every repeated component gain/noise lookup so each model
+        # is queried exactly once per call
+        # the 2025 variant drops the warm input amplifier and the 300 K
+        # attenuator; treat both as optional so it can inherit this method
+        wa_input = getattr(self, 'wa_input', None)
+        atten_300K = getattr(self, 'atten_300K', None)
+
+        g_input = self.input_gain(carrier_freq)
+        g_return = self.return_gain(carrier_freq)
+        g_wa_input = wa_input.gain(carrier_freq) if wa_input is not None else 0.0
+        g_wa1 = self.wa1.gain(carrier_freq)
+        g_wa2 = self.wa2.gain(carrier_freq)
+        input_cable_gain = self._input_cable_gain(carrier_freq)
+        n_lna_W = self.lna.noise(carrier_freq)
+
+        n_dac = self.ad9082.dac_noise(frange, carrier_power_dbm)
+        n_dac_lna = to_dbm(n_dac) + g_input
+        n_dac_output = n_dac_lna + g_return
+
+        # noise of the attenuators and input amplifier at the LNA
+        component_terms = [to_dbm(self.atten_FAA.noise())]
+        if atten_300K is not None:
+            component_terms.append(to_dbm(atten_300K.noise())
+                                   + g_wa_input + input_cable_gain)
+        if wa_input is not None:
+            component_terms.append(to_dbm(wa_input.noise(carrier_freq))
+                                   + g_wa_input + input_cable_gain)
+        # total of component noise not including LNA itself or dac
+        n_components_at_lna = _combine_noise_dbm(*component_terms)
+        # LNA itself
+        n_lna = to_dbm(n_lna_W)
+        n_total_at_lna = _combine_noise_dbm(n_dac_lna, n_lna, n_components_at_lna)
+
+        # # noise of the amplifiers on the return line
+        # (only wa1 reaches the total below; the wa2/lna/wa_input-at-output
+        # terms were computed and discarded, so they are gone)
+        n_wa1_output = to_dbm(self.wa1.noise(carrier_freq)) + g_wa1 + g_wa2
+
+        noise_total_output = _combine_noise_dbm(n_total_at_lna + g_return, n_wa1_output)
+
+        
+        return frange[0], noise_total_output, n_dac_output
+
+
+class SLIM_deployment_AC_line1(_SLIMDeployment2024Base):
+
+    INPUT_PATH = ('filter_hp', 'wa_input', 'atten_300K',
+                  'atten_4K', 'atten_GGG', 'atten_FAA')
+    INPUT_CABLES = ('warm_cables_in', 'cryo_cables_in_300to50',
+                    'cryo_cables_in_rest')
+    RETURN_PATH = ('lna', 'wa1', 'wa2',
+                   'cryo_cables_return_SS', 'cryo_cables_return_CuNi',
+                   'cryo_cables_return_NbTi', 'warm_cables_return')
+
+    # parts-list lengths for input_gain/return_gain, so callers can stack
+    # component gains into preallocated (N, K) buffers
+    _N_INPUT_PARTS = len(INPUT_PATH) + 1
+    _N_RETURN_PARTS = len(RETURN_PATH)
+
+    def __init__(self, freq_grid=None):
+
+        self.ad9082 = _shared_model(hardware_models.AD9082)
         
         # input attenuation & amplification
-        self.filter_hp = hardware_models.FilterHP_VHF1910p()
-        self.atten_300K = hardware_models.Attenuator(-10, 300)
-        self.wa_input = hardware_models.ZX60_3018Gplus()
+        self.filter_hp = _shared_model(hardware_models.FilterHP_VHF1910p)
+        self.atten_300K = _shared_model(hardware_models.Attenuator, -10, 300)
+        self.wa_input = _shared_model(hardware_models.ZX60_3018Gplus)
         
         # in cryostat
-        self.atten_4K = hardware_models.Attenuator(-20, 4)
-        self.atten_GGG = hardware_models.Attenuator(-10, 0.7)
-        self.atten_FAA = hardware_models.Attenuator(-10, 0.15) 
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -20, 4)
+        self.atten_GGG = _shared_model(hardware_models.Attenuator, -10, 0.7)
+        self.atten_FAA = _shared_model(hardware_models.Attenuator, -10, 0.15) 
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_FM_F141_cables(length_m=3)
-        self.cryo_cables_in_300to50 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
-        self.cryo_cables_in_rest = hardware_models.SMA_SS086_cryo(length_m=1.05, temperature=4)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
+        self.cryo_cables_in_300to50 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
+        self.cryo_cables_in_rest = _shared_model(hardware_models.SMA_SS086_cryo, 1.05, 4)
         
         # return amplifiers etc
-        self.lna = hardware_models.ASU_3GHz_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_FM_F141_cables(length_m=3)
-        self.cryo_cables_return_SS = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=50)
-        self.cryo_cables_return_CuNi = hardware_models.SMA_CuNi086_cryo(length_m=0.5, temperature=30)
-        self.cryo_cables_return_NbTi = hardware_models.SMA_NbTi086_cryo(length_m=0.75, temperature=4)
+        self.lna = _shared_model(hardware_models.ASU_3GHz_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
+        self.cryo_cables_return_SS = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 50)
+        self.cryo_cables_return_CuNi = _shared_model(hardware_models.SMA_CuNi086_cryo, 0.5, 30)
+        self.cryo_cables_return_NbTi = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.75, 4)
 #         self.atten_return_warm = hardware_models.Attenuator(-9, 300) ### is this present?
         
-    def input_gain(self, carrier_freq):
-        
-        outside_cs_components = self.filter_hp.gain(carrier_freq) + self.wa_input.gain(carrier_freq) + self.atten_300K.gain_meas(carrier_freq)
-        
-        inside_cs_components = self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq)
-        
-        cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cryo_cables_in_300to50.gain(carrier_freq) + self.cryo_cables_in_rest.gain(carrier_freq)
-        
-        return outside_cs_components + inside_cs_components + cable_gain
-    
-    
-    def return_gain(self, carrier_freq):
-        
-        amplifier_gain = self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        cable_gain = self.cryo_cables_return_SS.gain(carrier_freq) + self.cryo_cables_return_CuNi.gain(carrier_freq) + self.cryo_cables_return_NbTi.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq)
-        
-        return amplifier_gain + cable_gain
-    
-    
-    def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm):
+        self._finalize_tables(freq_grid)
+
+
+    def output_noise(self, carrier_freq, spectral_freq=None, carrier_power_dbm=None,
+                     frange=_DEFAULT_FRANGE):
+        # spectral_freq is unused and kept only so legacy positional
+        # callers still line up; prefer calling with keywords
+
+        # broadcast the carrier sweep against the spectral grid: carrier-
+        # dependent gains become (M, 1) columns and the frange-dependent DAC
+        # noise a (1, K) row, so one call yields the full (M, K) surface
+        carrier_freq = np.atleast_1d(np.asarray(carrier_freq, dtype=float))[:, None]
+        frange = np.atleast_1d(np.asarray(frange, dtype=float))[None, :]
+
+        # hoist every repeated component gain/noise lookup so each model
+        # is queried exactly once per call
+        g_input = self.input_gain(carrier_freq)
+        g_return = self.return_gain(carrier_freq)
+        g_wa_input = self.wa_input.gain(carrier_freq)
+        g_atten_4K = self.atten_4K.gain_meas(carrier_freq)
+        g_atten_GGG = self.atten_GGG.gain_meas(carrier_freq)
+        g_atten_FAA = self.atten_FAA.gain_meas(carrier_freq)
+        g_cables_rest = self.cryo_cables_in_rest.gain(carrier_freq)
+        input_cable_gain = self._input_cable_gain(carrier_freq)
+        g_wa1 = self.wa1.gain(carrier_freq)
+        g_wa2 = self.wa2.gain(carrier_freq)
+        n_wa_input = self.wa_input.noise(carrier_freq)
+        n_lna_W = self.lna.noise(carrier_freq)
 
         n_dac = self.ad9082.dac_noise(frange, carrier_power_dbm)
-        n_dac_lna = to_dbm(n_dac) + self.input_gain(carrier_freq)
-        n_dac_output = n_dac_lna + self.return_gain(carrier_freq)
+        n_dac_lna = to_dbm(n_dac) + g_input
+        n_dac_output = n_dac_lna + g_return
 
         # noise of the attenuators and input amplifier at the LNA
-        n_atten_300K_lna = to_dbm(self.atten_300K.noise()) + self.wa_input.gain(carrier_freq) + self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq) + self.warm_cables_in.gain(carrier_freq) + self.cryo_cables_in_300to50.gain(carrier_freq) + self.cryo_cables_in_rest.gain(carrier_freq)
-        n_wainput_lna = to_dbm(self.wa_input.noise(carrier_freq)) +self.wa_input.gain(carrier_freq) + self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq) + self.warm_cables_in.gain(carrier_freq) + self.cryo_cables_in_300to50.gain(carrier_freq) + self.cryo_cables_in_rest.gain(carrier_freq)
-        natten_4K_lna = to_dbm(self.atten_4K.noise()) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq) + self.cryo_cables_in_rest.gain(carrier_freq)
-        natten_GGG_lna = to_dbm(self.atten_GGG.noise()) + self.atten_FAA.gain_meas(carrier_freq) + self.cryo_cables_in_rest.gain(carrier_freq)*0.5
+        n_atten_300K_lna = to_dbm(self.atten_300K.noise()) + g_wa_input + g_atten_4K + g_atten_GGG + g_atten_FAA + input_cable_gain
+        n_wainput_lna = to_dbm(n_wa_input) + g_wa_input + g_atten_4K + g_atten_GGG + g_atten_FAA + input_cable_gain
+        natten_4K_lna = to_dbm(self.atten_4K.noise()) + g_atten_GGG + g_atten_FAA + g_cables_rest
+        natten_GGG_lna = to_dbm(self.atten_GGG.noise()) + g_atten_FAA + g_cables_rest*0.5
         natten_FAA_lna = to_dbm(self.atten_FAA.noise())
         # total of component noise not including LNA itself or dac
-        n_total_lna = to_dbm( to_W(natten_GGG_lna) + to_W(natten_FAA_lna) + to_W(natten_4K_lna) + to_W(n_atten_300K_lna) + to_W(n_wainput_lna))
+        n_total_lna = _combine_noise_dbm(natten_GGG_lna, natten_FAA_lna, natten_4K_lna, n_atten_300K_lna, n_wainput_lna)
         # LNA itself
-        n_lna = to_dbm(self.lna.noise(carrier_freq))
-        n_total_lna_all = to_dbm( to_W(n_dac_lna) + to_W(n_lna) + to_W(n_total_lna))
+        n_lna = to_dbm(n_lna_W)
+        n_total_lna_all = _combine_noise_dbm(n_dac_lna, n_lna, n_total_lna)
 
         # # noise of the amplifiers on the return line
-        n_wa1_output = to_dbm(self.wa1.noise(carrier_freq)) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        n_wa2_output = to_dbm(self.wa2.noise(carrier_freq)) + self.wa2.gain(carrier_freq)
-        n_lna_output = to_dbm(self.lna.noise(carrier_freq)) + self.return_gain(carrier_freq)
-        n_wainput_output = n_wainput_lna + self.return_gain(carrier_freq)
+        # (only wa1 reaches the total below; the wa2/lna/wa_input-at-output
+        # terms were computed and discarded, so they are gone)
+        n_wa1_output = to_dbm(self.wa1.noise(carrier_freq)) + g_wa1 + g_wa2
 
-        noise_total_output = to_dbm( to_W(n_total_lna_all + self.return_gain(carrier_freq)) + to_W(n_wa1_output))
+        noise_total_output = _combine_noise_dbm(n_total_lna_all + g_return, n_wa1_output)
 
         
-        return frange, noise_total_output, n_dac_output
+        return frange[0], noise_total_output, n_dac_output
     
     
-class SLIM_deployment_AC_line2(AnalogChain):
+class SLIM_deployment_AC_line2(_SLIMDeployment2024Base):
     '''
     more or less as above but make the cabling objects more modular to accommodate
     building one of these for each line in the cryostat fml
     '''
     
-    def __init__(self):
+    INPUT_PATH = ('filter_hp', 'wa_input', 'atten_300K',
+                  'atten_4K', 'atten_GGG', 'atten_FAA')
+    INPUT_CABLES = ('warm_cables_in', 'cables_300to50', 'cables_50to4',
+                    'cables_4toGGG', 'cables_GGGtoFAA')
+    RETURN_PATH = ('lna', 'wa1', 'wa2',
+                   'cables_FAAtoGGG', 'cables_GGGto4', 'cables_4to50',
+                   'cables_50to300', 'warm_cables_return')
+
+    # parts-list lengths for input_gain/return_gain, so callers can stack
+    # component gains into preallocated (N, K) buffers
+    _N_INPUT_PARTS = len(INPUT_PATH) + 1
+    _N_RETURN_PARTS = len(RETURN_PATH)
 
-        self.ad9082 = hardware_models.AD9082()
+    def __init__(self, freq_grid=None):
+
+        self.ad9082 = _shared_model(hardware_models.AD9082)
         
         # input attenuation & amplification
-        self.filter_hp = hardware_models.FilterHP_VHF1910p()
-        self.atten_300K = hardware_models.Attenuator(-10, 300)
-        self.wa_input = hardware_models.ZX60_3018Gplus()
+        self.filter_hp = _shared_model(hardware_models.FilterHP_VHF1910p)
+        self.atten_300K = _shared_model(hardware_models.Attenuator, -10, 300)
+        self.wa_input = _shared_model(hardware_models.ZX60_3018Gplus)
         
         # in cryostat
-        self.atten_4K = hardware_models.Attenuator(-20, 4)
-        self.atten_GGG = hardware_models.Attenuator(-10, 0.7)
-        self.atten_FAA = hardware_models.Attenuator(-10, 0.15) 
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -20, 4)
+        self.atten_GGG = _shared_model(hardware_models.Attenuator, -10, 0.7)
+        self.atten_FAA = _shared_model(hardware_models.Attenuator, -10, 0.15) 
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_FM_F141_cables(length_m=3)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
         
-        self.cables_300to50 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
-        self.cables_50to4 = hardware_models.SMA_SS219_cryo(length_m=0.5, temperature=4)
-        self.cables_4toGGG = hardware_models.SMA_SS219_cryo(length_m=0.3, temperature=4)
-        self.cables_GGGtoFAA = hardware_models.SMA_SS086_cryo(length_m=0.25, temperature=0.5)
+        self.cables_300to50 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
+        self.cables_50to4 = _shared_model(hardware_models.SMA_SS219_cryo, 0.5, 4)
+        self.cables_4toGGG = _shared_model(hardware_models.SMA_SS219_cryo, 0.3, 4)
+        self.cables_GGGtoFAA = _shared_model(hardware_models.SMA_SS086_cryo, 0.25, 0.5)
         
         
         # return cold cables
-        self.cables_FAAtoGGG = hardware_models.SMA_NbTi086_cryo(length_m=0.25, temperature=0.3)
-        self.cables_GGGto4 = hardware_models.SMA_NbTi086_cryo(length_m=0.5, temperature=4)
-        self.cables_4to50 = hardware_models.SMA_CuNi086_cryo(length_m=0.5, temperature=50)
-        self.cables_50to300 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
+        self.cables_FAAtoGGG = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.25, 0.3)
+        self.cables_GGGto4 = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.5, 4)
+        self.cables_4to50 = _shared_model(hardware_models.SMA_CuNi086_cryo, 0.5, 50)
+        self.cables_50to300 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
 
         # return amplifiers etc
-        self.lna = hardware_models.ASU_3GHz_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_FM_F141_cables(length_m=3)
-        
-    def input_gain(self, carrier_freq):
-        
-        outside_cs_components = self.filter_hp.gain(carrier_freq) + self.wa_input.gain(carrier_freq) + self.atten_300K.gain_meas(carrier_freq)
-        
-        inside_cs_components = self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq)
-        
-        cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
+        self.lna = _shared_model(hardware_models.ASU_3GHz_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
         
-        return outside_cs_components + inside_cs_components + cable_gain
-    
-    
-    def return_gain(self, carrier_freq):
-        
-        amplifier_gain = self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        cable_gain = self.cables_FAAtoGGG.gain(carrier_freq) + self.cables_GGGto4.gain(carrier_freq) + self.cables_4to50.gain(carrier_freq) + self.cables_50to300.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq)
-        
-        return amplifier_gain + cable_gain
-    
-    
-    def output_noise(self, carrier_freq, carrier_power_dbm, frange=np.logspace(-2, 2.5, 100)):
+        self._finalize_tables(freq_grid)
 
-        n_dac = self.ad9082.dac_noise(frange, carrier_power_dbm)
-        n_dac_lna = to_dbm(n_dac) + self.input_gain(carrier_freq)
-        n_dac_output = n_dac_lna + self.return_gain(carrier_freq)
 
-        # noise of the attenuators and input amplifier at the LNA
-        input_cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        n_atten_300K_lna = to_dbm(self.atten_300K.noise()) + self.wa_input.gain(carrier_freq) + input_cable_gain
-        n_wainput_lna = to_dbm(self.wa_input.noise(carrier_freq)) +self.wa_input.gain(carrier_freq) + input_cable_gain
-        natten_FAA_lna = to_dbm(self.atten_FAA.noise())
-        # total of component noise not including LNA itself or dac
-        n_components_at_lna = to_dbm( to_W(natten_FAA_lna) + to_W(n_atten_300K_lna) + to_W(n_wainput_lna))
-        # LNA itself
-        n_lna = to_dbm(self.lna.noise(carrier_freq))
-        n_total_at_lna = to_dbm( to_W(n_dac_lna) + to_W(n_lna) + to_W(n_components_at_lna))
-
-        # # noise of the amplifiers on the return line
-        n_wa1_output = to_dbm(self.wa1.noise(carrier_freq)) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        n_wa2_output = to_dbm(self.wa2.noise(carrier_freq)) + self.wa2.gain(carrier_freq)
-        n_lna_output = to_dbm(self.lna.noise(carrier_freq)) + self.return_gain(carrier_freq)
-        n_wainput_output = n_wainput_lna + self.return_gain(carrier_freq)
-
-        noise_total_output = to_dbm( to_W(n_total_at_lna + self.return_gain(carrier_freq)) + to_W(n_wa1_output))
 
-        
-        return frange, noise_total_output, n_dac_output
 
 
 
-class SLIM_deployment_AC_mincableloss(AnalogChain):
+class SLIM_deployment_AC_mincableloss(_SLIMDeployment2024Base):
     '''
     using the best possible (based on the deployment wiring sheet) combination of thick and short
     stainless steel SMA cables inside the cryostat, to see what the minimum reasonably expected
     cable loss is
     '''
     
-    def __init__(self):
+    INPUT_PATH = ('filter_hp', 'wa_input', 'atten_300K',
+                  'atten_4K', 'atten_GGG', 'atten_FAA')
+    INPUT_CABLES = ('warm_cables_in', 'cables_300to50', 'cables_50to4',
+                    'cables_4toGGG', 'cables_GGGtoFAA')
+    RETURN_PATH = ('lna', 'wa1', 'wa2',
+                   'cables_FAAtoGGG', 'cables_GGGto4', 'cables_4to50',
+                   'cables_50to300', 'warm_cables_return')
+
+    # parts-list lengths for input_gain/return_gain, so callers can stack
+    # component gains into preallocated (N, K) buffers
+    _N_INPUT_PARTS = len(INPUT_PATH) + 1
+    _N_RETURN_PARTS = len(RETURN_PATH)
+
+    def __init__(self, freq_grid=None):
 
-        self.ad9082 = hardware_models.AD9082()
+        self.ad9082 = _shared_model(hardware_models.AD9082)
         
         # input attenuation & amplification
-        self.filter_hp = hardware_models.FilterHP_VHF1910p()
-        self.atten_300K = hardware_models.Attenuator(-10, 300)
-        self.wa_input = hardware_models.ZX60_3018Gplus()
+        self.filter_hp = _shared_model(hardware_models.FilterHP_VHF1910p)
+        self.atten_300K = _shared_model(hardware_models.Attenuator, -10, 300)
+        self.wa_input = _shared_model(hardware_models.ZX60_3018Gplus)
         
         # in cryostat
-        self.atten_4K = hardware_models.Attenuator(-20, 4)
-        self.atten_GGG = hardware_models.Attenuator(-10, 0.7)
-        self.atten_FAA = hardware_models.Attenuator(-10, 0.15) 
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -20, 4)
+        self.atten_GGG = _shared_model(hardware_models.Attenuator, -10, 0.7)
+        self.atten_FAA = _shared_model(hardware_models.Attenuator, -10, 0.15) 
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_FM_F141_cables(length_m=4)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_FM_F141_cables, 4)
         
-        self.cables_300to50 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
-        self.cables_50to4 = hardware_models.SMA_SS219_cryo(length_m=0.5, temperature=4)
-        self.cables_4toGGG = hardware_models.SMA_SS219_cryo(length_m=0.3, temperature=4)
-        self.cables_GGGtoFAA = hardware_models.SMA_SS086_cryo(length_m=0.25, temperature=0.5)
+        self.cables_300to50 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
+        self.cables_50to4 = _shared_model(hardware_models.SMA_SS219_cryo, 0.5, 4)
+        self.cables_4toGGG = _shared_model(hardware_models.SMA_SS219_cryo, 0.3, 4)
+        self.cables_GGGtoFAA = _shared_model(hardware_models.SMA_SS086_cryo, 0.25, 0.5)
         
         
         # return amplifiers etc
-        self.lna = hardware_models.ASU_3GHz_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_FM_F141_cables(length_m=2)
+        self.lna = _shared_model(hardware_models.ASU_3GHz_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_FM_F141_cables, 2)
         
-        self.cables_FAAtoGGG = hardware_models.SMA_NbTi086_cryo(length_m=0.25, temperature=0.3)
-        self.cables_GGGto4 = hardware_models.SMA_NbTi086_cryo(length_m=0.3, temperature=4)
-        self.cables_4to50 = hardware_models.SMA_CuNi086_cryo(length_m=0.5, temperature=50)
-        self.cables_50to300 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
+        self.cables_FAAtoGGG = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.25, 0.3)
+        self.cables_GGGto4 = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.3, 4)
+        self.cables_4to50 = _shared_model(hardware_models.SMA_CuNi086_cryo, 0.5, 50)
+        self.cables_50to300 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
         
 #         self.atten_return_warm = hardware_models.Attenuator(-9, 300) ### is this present?
         
-    def input_gain(self, carrier_freq):
-        
-        outside_cs_components = self.filter_hp.gain(carrier_freq) + self.wa_input.gain(carrier_freq) + self.atten_300K.gain_meas(carrier_freq)
-        
-        inside_cs_components = self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq)
-        
-        cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        return outside_cs_components + inside_cs_components + cable_gain
-    
-    
-    def return_gain(self, carrier_freq):
-        
-        amplifier_gain = self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq) 
-        cable_gain = self.cables_FAAtoGGG.gain(carrier_freq) + self.cables_GGGto4.gain(carrier_freq) + self.cables_4to50.gain(carrier_freq) + self.cables_50to300.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq)
-        
-        return amplifier_gain + cable_gain
-    
-    
-    def output_noise(self, carrier_freq, carrier_power_dbm, frange=np.logspace(-2, 2.5, 100)):
-
-        n_dac = self.ad9082.dac_noise(frange, carrier_power_dbm)
-        n_dac_lna = to_dbm(n_dac) + self.input_gain(carrier_freq)
-        n_dac_output = n_dac_lna + self.return_gain(carrier_freq)
-
-        # noise of the attenuators and input amplifier at the LNA
-        input_cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        n_atten_300K_lna = to_dbm(self.atten_300K.noise()) + self.wa_input.gain(carrier_freq) + input_cable_gain
-        n_wainput_lna = to_dbm(self.wa_input.noise(carrier_freq)) +self.wa_input.gain(carrier_freq) + input_cable_gain
-        natten_FAA_lna = to_dbm(self.atten_FAA.noise())
-        # total of component noise not including LNA itself or dac
-        n_components_at_lna = to_dbm( to_W(natten_FAA_lna) + to_W(n_atten_300K_lna) + to_W(n_wainput_lna))
-        # LNA itself
-        n_lna = to_dbm(self.lna.noise(carrier_freq))
-        n_total_at_lna = to_dbm( to_W(n_dac_lna) + to_W(n_lna) + to_W(n_components_at_lna))
+        self._finalize_tables(freq_grid)
 
-        # # noise of the amplifiers on the return line
-        n_wa1_output = to_dbm(self.wa1.noise(carrier_freq)) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        n_wa2_output = to_dbm(self.wa2.noise(carrier_freq)) + self.wa2.gain(carrier_freq)
-        n_lna_output = to_dbm(self.lna.noise(carrier_freq)) + self.return_gain(carrier_freq)
-        n_wainput_output = n_wainput_lna + self.return_gain(carrier_freq)
 
-        noise_total_output = to_dbm( to_W(n_total_at_lna + self.return_gain(carrier_freq)) + to_W(n_wa1_output))
 
-        
-        return frange, noise_total_output, n_dac_output
     
 
-class SLIM_deployment_AC_maxcableloss(AnalogChain):
+class SLIM_deployment_AC_maxcableloss(_SLIMDeployment2024Base):
     '''
     using the worst possible (based on the deployment wiring sheet) combination of thin and long
     stainless steel SMA cables inside the cryostat, to see what the minimum reasonably expected
@@ -284,157 +455,141 @@ class SLIM_deployment_AC_maxcableloss(AnalogChain):
     also includes extra or less lengths of room temperature coax
     '''
     
-    def __init__(self):
+    INPUT_PATH = ('filter_hp', 'wa_input', 'atten_300K',
+                  'atten_4K', 'atten_GGG', 'atten_FAA')
+    INPUT_CABLES = ('warm_cables_in', 'cables_300to50', 'cables_50to4',
+                    'cables_4toGGG', 'cables_GGGtoFAA')
+    RETURN_PATH = ('lna', 'wa1', 'wa2',
+                   'cables_FAAtoGGG', 'cables_GGGto4', 'cables_4to50',
+                   'cables_50to300', 'warm_cables_return1', 'warm_cables_return2')
+
+    # parts-list lengths for input_gain/return_gain, so callers can stack
+    # component gains into preallocated (N, K) buffers
+    _N_INPUT_PARTS = len(INPUT_PATH) + 1
+    _N_RETURN_PARTS = len(RETURN_PATH)
 
-        self.ad9082 = hardware_models.AD9082()
+    def __init__(self, freq_grid=None):
+
+        self.ad9082 = _shared_model(hardware_models.AD9082)
         
         # input attenuation & amplification
-        self.filter_hp = hardware_models.FilterHP_VHF1910p()
-        self.atten_300K = hardware_models.Attenuator(-10, 300)
-        self.wa_input = hardware_models.ZX60_3018Gplus()
+        self.filter_hp = _shared_model(hardware_models.FilterHP_VHF1910p)
+        self.atten_300K = _shared_model(hardware_models.Attenuator, -10, 300)
+        self.wa_input = _shared_model(hardware_models.ZX60_3018Gplus)
         
         # in cryostat
-        self.atten_4K = hardware_models.Attenuator(-20, 4)
-        self.atten_GGG = hardware_models.Attenuator(-10, 0.7)
-        self.atten_FAA = hardware_models.Attenuator(-10, 0.15) 
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -20, 4)
+        self.atten_GGG = _shared_model(hardware_models.Attenuator, -10, 0.7)
+        self.atten_FAA = _shared_model(hardware_models.Attenuator, -10, 0.15) 
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_FM_F141_cables(length_m=4)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_FM_F141_cables, 4)
         
-        self.cables_300to50 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
-        self.cables_50to4 = hardware_models.SMA_SS086_cryo(length_m=0.5, temperature=4)
-        self.cables_4toGGG = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=4)
-        self.cables_GGGtoFAA = hardware_models.SMA_SS086_cryo(length_m=0.25, temperature=0.5)
+        self.cables_300to50 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
+        self.cables_50to4 = _shared_model(hardware_models.SMA_SS086_cryo, 0.5, 4)
+        self.cables_4toGGG = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 4)
+        self.cables_GGGtoFAA = _shared_model(hardware_models.SMA_SS086_cryo, 0.25, 0.5)
         
         
         # return amplifiers etc
-        self.lna = hardware_models.ASU_3GHz_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return1 = hardware_models.SMA_FM_F141_cables(length_m=2)
-        self.warm_cables_return2 = hardware_models.SMA_FM_F141_cables(length_m=1)
+        self.lna = _shared_model(hardware_models.ASU_3GHz_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return1 = _shared_model(hardware_models.SMA_FM_F141_cables, 2)
+        self.warm_cables_return2 = _shared_model(hardware_models.SMA_FM_F141_cables, 1)
         
-        self.cables_FAAtoGGG = hardware_models.SMA_NbTi086_cryo(length_m=0.25, temperature=0.3)
-        self.cables_GGGto4 = hardware_models.SMA_NbTi086_cryo(length_m=0.3, temperature=4)
-        self.cables_4to50 = hardware_models.SMA_CuNi086_cryo(length_m=0.5, temperature=50)
-        self.cables_50to300 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
+        self.cables_FAAtoGGG = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.25, 0.3)
+        self.cables_GGGto4 = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.3, 4)
+        self.cables_4to50 = _shared_model(hardware_models.SMA_CuNi086_cryo, 0.5, 50)
+        self.cables_50to300 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
         
 #         self.atten_return_warm = hardware_models.Attenuator(-9, 300) ### is this present?
         
-    def input_gain(self, carrier_freq):
-        
-        outside_cs_components = self.filter_hp.gain(carrier_freq) + self.wa_input.gain(carrier_freq) + self.atten_300K.gain_meas(carrier_freq)
-        
-        inside_cs_components = self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq)
-        
-        cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        return outside_cs_components + inside_cs_components + cable_gain
-    
-    
-    def return_gain(self, carrier_freq):
-        
-        amplifier_gain = self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        cable_gain = self.cables_FAAtoGGG.gain(carrier_freq) + self.cables_GGGto4.gain(carrier_freq) + self.cables_4to50.gain(carrier_freq) + self.cables_50to300.gain(carrier_freq) + self.warm_cables_return1.gain(carrier_freq) + self.warm_cables_return2.gain(carrier_freq)
-        
-        return amplifier_gain + cable_gain
-    
-    
-    def output_noise(self, carrier_freq, carrier_power_dbm, frange=np.logspace(-2, 2.5, 100)):
+        self._finalize_tables(freq_grid)
 
-        n_dac = self.ad9082.dac_noise(frange, carrier_power_dbm)
-        n_dac_lna = to_dbm(n_dac) + self.input_gain(carrier_freq)
-        n_dac_output = n_dac_lna + self.return_gain(carrier_freq)
 
-        # noise of the attenuators and input amplifier at the LNA
-        input_cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        n_atten_300K_lna = to_dbm(self.atten_300K.noise()) + self.wa_input.gain(carrier_freq) + input_cable_gain
-        n_wainput_lna = to_dbm(self.wa_input.noise(carrier_freq)) +self.wa_input.gain(carrier_freq) + input_cable_gain 
-        natten_FAA_lna = to_dbm(self.atten_FAA.noise())
-        # total of component noise not including LNA itself or dac
-        n_components_at_lna = to_dbm( to_W(natten_FAA_lna) + to_W(n_atten_300K_lna) + to_W(n_wainput_lna))
-        # LNA itself
-        n_lna = to_dbm(self.lna.noise(carrier_freq))
-        n_total_at_lna = to_dbm( to_W(n_dac_lna) + to_W(n_lna) + to_W(n_components_at_lna))
 
-        # # noise of the amplifiers on the return line
-        n_wa1_output = to_dbm(self.wa1.noise(carrier_freq)) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        n_wa2_output = to_dbm(self.wa2.noise(carrier_freq)) + self.wa2.gain(carrier_freq)
-        n_lna_output = to_dbm(self.lna.noise(carrier_freq)) + self.return_gain(carrier_freq)
-        n_wainput_output = n_wainput_lna + self.return_gain(carrier_freq)
-
-        noise_total_output = to_dbm( to_W(n_total_at_lna + self.return_gain(carrier_freq)) + to_W(n_wa1_output))
-
-        
-        return frange, noise_total_output, n_dac_output
     
 
 
 
 
-class SLIM_deployment_AC_2025(AnalogChain):
+class SLIM_deployment_AC_2025(_SLIMDeployment2024Base):
     '''
     possible 2025 deployment analog chain
     key difference: remove some cold attenuators on the input
     maybe also remove the first stage amp...?
     '''
     
-    def __init__(self):
+    INPUT_PATH = ('filter_hp', 'atten_4K', 'atten_GGG', 'atten_FAA')
+    INPUT_CABLES = ('warm_cables_in', 'cables_300to50', 'cables_50to4',
+                    'cables_4toGGG', 'cables_GGGtoFAA')
+    RETURN_PATH = ('lna', 'wa1', 'wa2',
+                   'cables_FAAtoGGG', 'cables_GGGto4', 'cables_4to50',
+                   'cables_50to300', 'warm_cables_return')
 
-        self.ad9082 = hardware_models.AD9082()
+    # parts-list lengths for input_gain/return_gain, so callers can stack
+    # component gains into preallocated (N, K) buffers
+    _N_INPUT_PARTS = len(INPUT_PATH) + 1
+    _N_RETURN_PARTS = len(RETURN_PATH)
+
+    def __init__(self, freq_grid=None):
+
+        self.ad9082 = _shared_model(hardware_models.AD9082)
         
         # input attenuation & amplification
-        self.filter_hp = hardware_models.FilterHP_VHF1910p()
+        self.filter_hp = _shared_model(hardware_models.FilterHP_VHF1910p)
         # self.atten_300K = hardware_models.Attenuator(-10, 300)
         # self.wa_input = hardware_models.ZX60_3018Gplus()
         
         # in cryostat
-        self.atten_4K = hardware_models.Attenuator(-10, 4)
-        self.atten_GGG = hardware_models.Attenuator(0, 0.7)
-        self.atten_FAA = hardware_models.Attenuator(-10, 0.15) 
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -10, 4)
+        self.atten_GGG = _shared_model(hardware_models.Attenuator, 0, 0.7)
+        self.atten_FAA = _shared_model(hardware_models.Attenuator, -10, 0.15) 
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_FM_F141_cables(length_m=3)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
         
-        self.cables_300to50 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
-        self.cables_50to4 = hardware_models.SMA_SS219_cryo(length_m=0.5, temperature=4)
-        self.cables_4toGGG = hardware_models.SMA_SS219_cryo(length_m=0.3, temperature=4)
-        self.cables_GGGtoFAA = hardware_models.SMA_SS086_cryo(length_m=0.25, temperature=0.5)
+        self.cables_300to50 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
+        self.cables_50to4 = _shared_model(hardware_models.SMA_SS219_cryo, 0.5, 4)
+        self.cables_4toGGG = _shared_model(hardware_models.SMA_SS219_cryo, 0.3, 4)
+        self.cables_GGGtoFAA = _shared_model(hardware_models.SMA_SS086_cryo, 0.25, 0.5)
         
         
         # return amplifiers etc
-        self.lna = hardware_models.ASU_3GHz_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_FM_F141_cables(length_m=3)
+        self.lna = _shared_model(hardware_models.ASU_3GHz_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
         
-        self.cables_FAAtoGGG = hardware_models.SMA_NbTi086_cryo(length_m=0.25, temperature=0.3)
-        self.cables_GGGto4 = hardware_models.SMA_NbTi086_cryo(length_m=0.5, temperature=4)
-        self.cables_4to50 = hardware_models.SMA_CuNi086_cryo(length_m=0.5, temperature=50)
-        self.cables_50to300 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
+        self.cables_FAAtoGGG = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.25, 0.3)
+        self.cables_GGGto4 = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.5, 4)
+        self.cables_4to50 = _shared_model(hardware_models.SMA_CuNi086_cryo, 0.5, 50)
+        self.cables_50to300 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
         
 #         self.atten_return_warm = hardware_models.Attenuator(-9, 300) ### is this present?
         
-    def input_gain(self, carrier_freq):
-        
-        outside_cs_components = self.filter_hp.gain(carrier_freq) #+ self.wa_input.gain(carrier_freq) + self.atten_300K.gain_meas(carrier_freq)
-        
-        inside_cs_components = self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq)
-        
-        cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        return outside_cs_components + inside_cs_components + cable_gain
-    
-    
-    def return_gain(self, carrier_freq):
-        
-        amplifier_gain = self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        cable_gain = self.cables_FAAtoGGG.gain(carrier_freq) + self.cables_GGGto4.gain(carrier_freq) + self.cables_4to50.gain(carrier_freq) + self.cables_50to300.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq)
-        
-        return amplifier_gain + cable_gain
-    
-    
-    def output_noise(self, carrier_freq, carrier_power_dbm, frange=np.logspace(-2, 2.5, 100)):
+        self._finalize_tables(freq_grid)
 
-        return 0
+
+def compute_all_chains(chains, carrier_freqs, carrier_power_dbm,
+                       frange=_DEFAULT_FRANGE):
+    '''
+    Evaluate output_noise for several chain variants on a common sweep.
+
+    Returns (frange, total, dac) where total and dac have shape
+    (n_chains, n_carriers, n_frange). Each chain's noise surface is
+    already computed by one vectorized call, so the Python loop here
+    only runs once per variant and contributes nothing measurable to
+    the runtime.
+    '''
+    carrier_freqs = np.atleast_1d(np.asarray(carrier_freqs, dtype=float))
+    frange = np.atleast_1d(np.asarray(frange, dtype=float))
+    total = np.empty((len(chains), carrier_freqs.size, frange.size))
+    dac = np.empty_like(total)
+    for i, chain in enumerate(chains):
+        # keyword call works for both signatures: line1 keeps a legacy
+        # (unused) spectral_freq slot before carrier_power_dbm
+        _, total[i], dac[i] = chain.output_noise(
+            carrier_freqs, carrier_power_dbm=carrier_power_dbm, frange=frange)
+    return frange, total, dac
@@ -1,3 +1,6 @@
+import dataclasses
+import functools
+import hashlib
 import numpy as np
 import os
 import pickle
@@ -9,181 +12,464 @@ import hidfmux.core.resources.hardware_models as hardware_models
 import hidfmux.core.utils.transferfunctions as transferfunctions
 from hidfmux.core.utils.transferfunctions import to_dbm, to_W
 
+from hardware_models import shared_model as _shared_model
 
+
+@functools.cache
+def _models_salt():
+    # hash of the hardware-models source: edits to a datasheet constant,
+    # interpolation table or transfer-function formula must invalidate
+    # the on-disk gain-table cache even though no constructor argument
+    # changes
+    try:
+        with open(hardware_models.__file__, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return getattr(hardware_models, '__version__', '')
+
+
+def _db_to_lin(gain_db):
+    # dB -> linear power ratio; kept local so the hot path avoids the
+    # to_W/to_dbm round-trips of the dBm-domain formulation
+    return 10 ** (np.asarray(gain_db, dtype=float) * 0.1)
+
+
+def _combine_output_noise(n_dac_lna_W, n_components_W, g_return_lin,
+                          n_wa1_output_W):
+    # fused arithmetic tail of output_noise: refer everything at the LNA to
+    # the output, add the warm-amplifier term and convert to dBm once
+    return 10.0 * np.log10((n_dac_lna_W + n_components_W) * g_return_lin
+                           + n_wa1_output_W) + 30.0
+
+
+try:
+    # compile the hot kernel when numba is around; the fallback above is
+    # identical plain numpy. cache=True keeps recompiles off the first call.
+    import numba
+    _combine_output_noise = numba.njit(fastmath=True, cache=True)(_combine_output_noise)
+    _combine_output_noise(np.ones(2), 1.0, 1.0, 1.0)
+except ImportError:
+    pass
+
+
+def _sum_gains(chain, carrier_freq):
+    '''
+    Evaluate every bound gain method in `chain` on carrier_freq and reduce
+    with one vectorized sum over a preallocated (n_components, ...) buffer,
+    instead of chaining Python __add__ calls component by component.
+    '''
+    freqs = np.asarray(carrier_freq, dtype=float)
+    out = np.empty((len(chain),) + freqs.shape)
+    for i, gain in enumerate(chain):
+        out[i] = gain(freqs)
+    return out.sum(axis=0)
+
+
+@dataclasses.dataclass(frozen=True)
+class ChainSpec:
+    '''
+    Immutable, hashable description of a gain chain.
+
+    `stages` is a tuple of (model class, constructor args, gain method
+    name) entries. Frozen specs compare and hash structurally, so they
+    key straight into gain_lut's lru_cache (and the on-disk cache) with
+    no separate hashing step: two deployments declaring the same stages
+    share one materialized chain and one LUT.
+    '''
+
+    stages: tuple
+
+    def materialize(self):
+        # flyweight-backed models, one bound gain method per stage
+        return tuple(getattr(_shared_model(cls, *args), method)
+                     for cls, args, method in self.stages)
+
+
+@functools.lru_cache(maxsize=None)
+def gain_lut(spec):
+    '''
+    Summed gain spectrum of a ChainSpec on the shared LUT grid, computed
+    once per distinct topology for the life of the process.
+    '''
+    return _compile_chain_sum(spec.materialize())(_LUT_GRID).astype(np.float32)
+
+
+def _compile_chain_sum(chain):
+    '''
+    Partially evaluate a chain tuple into a straight-line adder.
+
+    The generated body is `g0(f) + g1(f) + ...` over the bound gain
+    methods — no loop, no tuple indexing, no buffer — which is the exact
+    (non-interpolated) evaluator used to fill the LUT tables and for any
+    off-grid query that must bypass them.
+    '''
+    names = ['g%d' % i for i in range(len(chain))]
+    namespace = dict(zip(names, chain))
+    exec('def _f(f): return ' + ' + '.join(n + '(f)' for n in names),
+         namespace)
+    return namespace['_f']
+
+
+# dense tabulation grid shared by every per-component gain LUT; fine
+# enough that linear interpolation error is negligible over the band
+_LUT_GRID = np.linspace(0.0, 3e9, 4096)
+
+# on-disk home for precomputed chain LUTs, keyed by chain signature
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'mkids_chain')
+
+
+class _LUTChainBase(AnalogChain):
+    '''
+    Shared gain-LUT plumbing for the deployment chains below.
+
+    Subclasses build their components in __init__, declare the signal path
+    by overriding _build_chains(), and finish with _rebuild_gain_luts().
+    The summed input/return spectra are precomputed once, so each gain
+    query is a single np.interp regardless of chain length; reassigning a
+    component afterwards marks the LUTs dirty and the next query rebuilds.
+
+    Leaf classes list their component attributes in __slots__; with the
+    LUT bookkeeping slotted here, no instance carries a __dict__.
+    '''
+
+    __slots__ = ('_input_chain', '_return_chain',
+                 '_input_gain_table', '_return_gain_table',
+                 '_direct_input_gain', '_direct_return_gain',
+                 '_chain_tables', '_chain_tables_lin',
+                 '_luts_built', '_luts_dirty')
+
+    def __setattr__(self, name, value):
+        # swapping out a component (public attribute) invalidates the
+        # precomputed gain LUTs until the next gain query rebuilds them
+        if not name.startswith('_') and getattr(self, '_luts_built', False):
+            object.__setattr__(self, '_luts_dirty', True)
+        object.__setattr__(self, name, value)
+
+    def _build_chains(self):
+        raise NotImplementedError
+
+    def _rebuild_gain_luts(self):
+        self._build_chains()
+        # specialize an unrolled exact evaluator per chain while the
+        # composition is fixed; the LUTs below stay the per-query hot path
+        self._direct_input_gain = _compile_chain_sum(self._input_chain)
+        self._direct_return_gain = _compile_chain_sum(self._return_chain)
+        self._lut_grid = _LUT_GRID
+        cached = self._load_cached_tables()
+        if cached is not None:
+            (self._input_gain_table, self._return_gain_table,
+             self._chain_tables, self._chain_tables_lin) = cached
+        else:
+            # float32 is ample for dB transfer functions (the underlying
+            # measurements carry 2-3 digits) and halves the bytes streamed
+            # through cache when reducing the stacked tables
+            self._input_gain_table = np.stack(
+                [g(self._lut_grid) for g in self._input_chain]).astype(np.float32)
+            self._return_gain_table = np.stack(
+                [g(self._lut_grid) for g in self._return_chain]).astype(np.float32)
+            # the summed spectra, keyed by chain name, are what _chain_gain
+            # actually serves; subclasses may register further chains here
+            self._chain_tables = {
+                'input': self._direct_input_gain(self._lut_grid).astype(np.float32),
+                'return': self._direct_return_gain(self._lut_grid).astype(np.float32),
+            }
+            # linear-power twins of the summed spectra, so output_noise can
+            # multiply straight off the LUT without a dB round-trip per call
+            self._chain_tables_lin = {key: _db_to_lin(table).astype(np.float32)
+                                      for key, table in self._chain_tables.items()}
+            self._store_cached_tables()
+        self._luts_built = True
+        self._luts_dirty = False
+
+    def _component_signature(self):
+        # the chain is determined by its class, the LUT grid and the
+        # (model class, numeric parameters) of every path component --
+        # plus the model library source itself, salted in so a library
+        # update never serves stale tables
+        spec = [_models_salt(),
+                type(self).__qualname__,
+                (float(_LUT_GRID[0]), float(_LUT_GRID[-1]), _LUT_GRID.size)]
+        for gain in self._input_chain + self._return_chain:
+            component = gain.__self__
+            params = tuple(sorted((k, v) for k, v in vars(component).items()
+                                  if isinstance(v, (int, float))))
+            spec.append((type(component).__name__, gain.__name__, params))
+        return repr(spec)
+
+    def _cache_path(self):
+        sig = hashlib.sha1(self._component_signature().encode()).hexdigest()
+        return os.path.join(_CACHE_DIR, sig + '.pkl')
+
+    def _load_cached_tables(self):
+        try:
+            with open(self._cache_path(), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _store_cached_tables(self):
+        payload = (self._input_gain_table, self._return_gain_table,
+                   self._chain_tables, self._chain_tables_lin)
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(), 'wb') as f:
+                pickle.dump(payload, f)
+        except OSError:
+            # the cache is best-effort; a read-only home is not an error
+            pass
+
+    def _chain_gain(self, chain_key, carrier_freq):
+        # single hot path for every registered chain: one np.interp
+        # against the precomputed summed spectrum
+        if self._luts_dirty:
+            self._rebuild_gain_luts()
+        return np.interp(carrier_freq, self._lut_grid,
+                         self._chain_tables[chain_key])
+
+    @classmethod
+    def build_many(cls, n):
+        '''
+        Build n chain instances, one per cryostat line.
+
+        The first instance is constructed normally; the rest are shallow
+        clones that reference the same (flyweight) hardware models and the
+        same precomputed LUT arrays, so multi-line deployments pay the
+        table build exactly once.
+        '''
+        if n <= 0:
+            return []
+        proto = cls()
+        chains = [proto]
+        for _ in range(n - 1):
+            clone = cls.__new__(cls)
+            for klass in type(proto).__mro__:
+                for name in getattr(klass, '__slots__', ()):
+                    try:
+                        object.__setattr__(clone, name, getattr(proto, name))
+                    except AttributeError:
+                        # optional bookkeeping slot never set on the proto
+                        pass
+            chains.append(clone)
+        return chains
+
+    def _chain_linear_gain(self, chain_key, carrier_freq):
+        # composite gain as a linear power ratio, served from the
+        # precomputed linear table
+        if self._luts_dirty:
+            self._rebuild_gain_luts()
+        return np.interp(carrier_freq, self._lut_grid,
+                         self._chain_tables_lin[chain_key])
+
+    def input_gain(self, carrier_freq):
+        
+        return self._chain_gain('input', carrier_freq)
     
     
-class SLIM_deployment_AC_v1(AnalogChain):
+    def return_gain(self, carrier_freq):
+        
+        return self._chain_gain('return', carrier_freq)
+
+
+    def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm):
+
+        # fully broadcast over the spectral grid: every op below is an
+        # ndarray expression, with all accumulation in linear (W) domain —
+        # one _db_to_lin per composite gain and a single to_dbm per
+        # returned quantity, no Python-level loop over bins
+        spectral_freq = np.asarray(spectral_freq, dtype=np.float64)
+
+        g_return_lin = self._chain_linear_gain('return', carrier_freq)
+
+        n_dac_lna_W = (self.ad9082.dac_noise(spectral_freq, carrier_power_dbm)
+                       * self._chain_linear_gain('input', carrier_freq))
+        n_dac_output = to_dbm(n_dac_lna_W * g_return_lin)
+
+        # component noise at the LNA: neither variant has a warm input
+        # amplifier or 300 K attenuator, so only the FAA attenuator
+        # contributes alongside the DAC and the LNA itself
+        n_components_W = self.lna.noise(carrier_freq) + self.atten_FAA.noise()
+
+        # of the return-line amplifiers only wa1 contributes measurably;
+        # its noise is referred to the output through wa1 and wa2
+        n_wa1_output_W = self.wa1.noise(carrier_freq) * _db_to_lin(
+            self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq))
+
+        noise_total_output = _combine_output_noise(
+            n_dac_lna_W, n_components_W, g_return_lin, n_wa1_output_W)
+
+        return spectral_freq, noise_total_output, n_dac_output
+
+
+class SLIM_deployment_AC_v1(_LUTChainBase):
     '''
     more or less as above but make the cabling objects more modular to accommodate
     building one of these for each line in the cryostat fml
     '''
-    
+
+    __slots__ = ('ad9082', 'filter_hp',
+                 'atten_4K', 'atten_GGG', 'atten_FAA',
+                 'patch_cables_in', 'warm_cables_in',
+                 'cables_300to50', 'cables_50to4',
+                 'cables_4toGGG', 'cables_GGGtoFAA',
+                 'lna', 'wa1', 'wa2',
+                 'warm_cables_return', 'patch_cable_wa1_to_wa2',
+                 'patch_cable_wa2_to_panel', 'patch_cable_panel',
+                 'patch_cable_panel_iceboard',
+                 'cables_FAAtoGGG', 'cables_GGGto4',
+                 'cables_4to50', 'cables_50to300',
+                 'all_cold_cables_in', 'all_cold_cables_return',
+                 'all_patch_cables_return',
+                 '_cold_in_gain', '_cold_return_gain', '_patch_return_gain')
+
     def __init__(self):
 
-        self.ad9082 = hardware_models.AD9082()
+        self.ad9082 = _shared_model(hardware_models.AD9082)
         
         # input attenuation & amplification
-        self.filter_hp = hardware_models.FilterHP_VHF1910p()
-        # self.atten_300K = hardware_models.Attenuator(-10, 300)
-        # self.wa_input = hardware_models.ZX60_3018Gplus()
+        self.filter_hp = _shared_model(hardware_models.FilterHP_VHF1910p)
+        # self.atten_300K = _shared_model(hardware_models.Attenuator, -10, 300)
+        # self.wa_input = _shared_model(hardware_models.ZX60_3018Gplus)
         
         # in cryostat
-        self.atten_4K = hardware_models.Attenuator(-20, 4)
-        self.atten_GGG = hardware_models.Attenuator(-10, 0.5)
-        self.atten_FAA = hardware_models.Attenuator(0, 0.15) 
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -20, 4)
+        self.atten_GGG = _shared_model(hardware_models.Attenuator, -10, 0.5)
+        self.atten_FAA = _shared_model(hardware_models.Attenuator, 0, 0.15) 
         
         # input cables
-        self.patch_cables_in = hardware_models.SMA_RG58C_cables(length_m=0.3)
-        self.warm_cables_in = hardware_models.SMA_FM_F141_cables(length_m=3.5)
+        self.patch_cables_in = _shared_model(hardware_models.SMA_RG58C_cables, 0.3)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_FM_F141_cables, 3.5)
         
-        self.cables_300to50 = hardware_models.BCB014_SS085_cryo(length_m=0.3, temperature=300)
-        self.cables_50to4 = hardware_models.BCB014_SS085_cryo(length_m=0.5, temperature=4)
-        self.cables_4toGGG = hardware_models.BCB029_SS034_cryo(length_m=0.3, temperature=4)
-        self.cables_GGGtoFAA = hardware_models.BCB029_SS034_cryo(length_m=0.3, temperature=0.5)
+        self.cables_300to50 = _shared_model(hardware_models.BCB014_SS085_cryo, 0.3, 300)
+        self.cables_50to4 = _shared_model(hardware_models.BCB014_SS085_cryo, 0.5, 4)
+        self.cables_4toGGG = _shared_model(hardware_models.BCB029_SS034_cryo, 0.3, 4)
+        self.cables_GGGtoFAA = _shared_model(hardware_models.BCB029_SS034_cryo, 0.3, 0.5)
         
         
         # return amplifiers etc
-        self.lna = hardware_models.ASU_3GHz_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_FM_F141_cables(length_m=3.5)
-        self.patch_cable_wa1_to_wa2 = hardware_models.SMA_RG174A_cables(length_m=0.15)
-        self.patch_cable_wa2_to_panel = hardware_models.SMA_RG58C_cables(length_m=0.3)
-        self.patch_cable_panel = hardware_models.SMA_RG174A_cables(length_m=0.6)
-        self.patch_cable_panel_iceboard = hardware_models.SMA_RG58C_cables(length_m=0.3)
-        
-        self.cables_FAAtoGGG = hardware_models.BCB012_NbTi034_cryo(length_m=0.3, temperature=0.3)
-        self.cables_GGGto4 = hardware_models.BCB012_NbTi034_cryo(length_m=0.3, temperature=4)
-        self.cables_4to50 = hardware_models.BCB014_SS085_cryo(length_m=0.5, temperature=50)
-        self.cables_50to300 = hardware_models.BCB014_SS085_cryo(length_m=0.3, temperature=300)
+        self.lna = _shared_model(hardware_models.ASU_3GHz_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_FM_F141_cables, 3.5)
+        self.patch_cable_wa1_to_wa2 = _shared_model(hardware_models.SMA_RG174A_cables, 0.15)
+        self.patch_cable_wa2_to_panel = _shared_model(hardware_models.SMA_RG58C_cables, 0.3)
+        self.patch_cable_panel = _shared_model(hardware_models.SMA_RG174A_cables, 0.6)
+        self.patch_cable_panel_iceboard = _shared_model(hardware_models.SMA_RG58C_cables, 0.3)
+        
+        self.cables_FAAtoGGG = _shared_model(hardware_models.BCB012_NbTi034_cryo, 0.3, 0.3)
+        self.cables_GGGto4 = _shared_model(hardware_models.BCB012_NbTi034_cryo, 0.3, 4)
+        self.cables_4to50 = _shared_model(hardware_models.BCB014_SS085_cryo, 0.5, 50)
+        self.cables_50to300 = _shared_model(hardware_models.BCB014_SS085_cryo, 0.3, 300)
 
         # probably it will be useful to have some collections of objects...?
         self.all_cold_cables_in = [self.cables_300to50, self.cables_50to4, self.cables_4toGGG, self.cables_GGGtoFAA]
         self.all_cold_cables_return = [self.cables_FAAtoGGG, self.cables_GGGto4, self.cables_4to50, self.cables_50to300]
         self.all_patch_cables_return = [self.warm_cables_return, self.patch_cable_wa1_to_wa2, self.patch_cable_wa2_to_panel, self.patch_cable_panel, self.patch_cable_panel_iceboard]
-        
-        
-    def input_gain(self, carrier_freq):
-        
-        warm_component_gain = self.filter_hp.gain(carrier_freq)
-        warm_cable_gain = self.patch_cables_in.gain(carrier_freq) + self.warm_cables_in.gain(carrier_freq)
-
-        cold_component_gain = self.atten_4K.gain(carrier_freq) + self.atten_GGG.gain(carrier_freq) + self.atten_FAA.gain(carrier_freq)
-        cold_cable_gain = self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        return warm_component_gain + warm_cable_gain + cold_component_gain + cold_cable_gain
-    
-    
-    def return_gain(self, carrier_freq):
-        
-        cold_component_gain = self.lna.gain(carrier_freq)
-        cold_cable_gain = self.cables_FAAtoGGG.gain(carrier_freq) + self.cables_GGGto4.gain(carrier_freq) + self.cables_4to50.gain(carrier_freq) + self.cables_50to300.gain(carrier_freq) 
-        
-        warm_component_gain = self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        warm_cable_gain = self.warm_cables_return.gain(carrier_freq) + self.patch_cable_wa1_to_wa2.gain(carrier_freq) + self.patch_cable_wa2_to_panel.gain(carrier_freq) + self.patch_cable_panel.gain(carrier_freq) + self.patch_cable_panel_iceboard.gain(carrier_freq)
-        
-        return cold_component_gain + cold_cable_gain + warm_component_gain + warm_cable_gain
-    
-    
-    def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm):
 
-        '''
-        n_dac = self.ad9082.dac_noise(spectral_freq, carrier_power_dbm)
-        n_dac_lna = to_dbm(n_dac) + self.input_gain(carrier_freq)
-        n_dac_output = n_dac_lna + self.return_gain(carrier_freq)
+        self._rebuild_gain_luts()
 
-        # noise of the attenuators and input amplifier at the LNA
-        input_cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        n_atten_300K_lna = to_dbm(self.atten_300K.noise()) + self.wa_input.gain(carrier_freq) + input_cable_gain
-        n_wainput_lna = to_dbm(self.wa_input.noise(carrier_freq)) +self.wa_input.gain(carrier_freq) + input_cable_gain
-        natten_FAA_lna = to_dbm(self.atten_FAA.noise())
-        # total of component noise not including LNA itself or dac
-        n_components_at_lna = to_dbm( to_W(natten_FAA_lna) + to_W(n_atten_300K_lna) + to_W(n_wainput_lna))
-        # LNA itself
-        n_lna = to_dbm(self.lna.noise(carrier_freq))
-        n_total_at_lna = to_dbm( to_W(n_dac_lna) + to_W(n_lna) + to_W(n_components_at_lna))
+    def _build_chains(self):
+        # fixed evaluation order for the vectorized gain reductions
+        self._input_chain = (
+            self.filter_hp.gain,
+            self.patch_cables_in.gain, self.warm_cables_in.gain,
+            self.atten_4K.gain, self.atten_GGG.gain, self.atten_FAA.gain,
+            self.cables_300to50.gain, self.cables_50to4.gain,
+            self.cables_4toGGG.gain, self.cables_GGGtoFAA.gain)
+        self._return_chain = (
+            self.lna.gain,
+            self.cables_FAAtoGGG.gain, self.cables_GGGto4.gain,
+            self.cables_4to50.gain, self.cables_50to300.gain,
+            self.wa1.gain, self.wa2.gain,
+            self.warm_cables_return.gain, self.patch_cable_wa1_to_wa2.gain,
+            self.patch_cable_wa2_to_panel.gain, self.patch_cable_panel.gain,
+            self.patch_cable_panel_iceboard.gain)
 
-        # # noise of the amplifiers on the return line
-        n_wa1_output = to_dbm(self.wa1.noise(carrier_freq)) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        n_wa2_output = to_dbm(self.wa2.noise(carrier_freq)) + self.wa2.gain(carrier_freq)
-        n_lna_output = to_dbm(self.lna.noise(carrier_freq)) + self.return_gain(carrier_freq)
-        n_wainput_output = n_wainput_lna + self.return_gain(carrier_freq)
-
-        noise_total_output = to_dbm( to_W(n_total_at_lna + self.return_gain(carrier_freq)) + to_W(n_wa1_output))
-
-        
-        return frange, noise_total_output, n_dac_output
-        '''
-        return 0 ### todo
+        # SoA views of the cable collections: one (n_cables, n_grid) gain
+        # spectrum stack per group, so any grouped cable-loss sum is a
+        # contiguous .sum(axis=0) instead of a walk over Python objects
+        self._cold_in_gain = np.stack(
+            [c.gain(_LUT_GRID) for c in self.all_cold_cables_in]).astype(np.float32)
+        self._cold_return_gain = np.stack(
+            [c.gain(_LUT_GRID) for c in self.all_cold_cables_return]).astype(np.float32)
+        self._patch_return_gain = np.stack(
+            [c.gain(_LUT_GRID) for c in self.all_patch_cables_return]).astype(np.float32)
+    
+    
 
 
 
 
 
 
-class SLIM_deployment_AC_2025(AnalogChain):
+class SLIM_deployment_AC_2025(_LUTChainBase):
     '''
     possible 2025 deployment analog chain
     key difference: remove some cold attenuators on the input
     maybe also remove the first stage amp...?
     '''
-    
+
+    __slots__ = ('ad9082', 'filter_hp',
+                 'atten_4K', 'atten_GGG', 'atten_FAA',
+                 'warm_cables_in',
+                 'cables_300to50', 'cables_50to4',
+                 'cables_4toGGG', 'cables_GGGtoFAA',
+                 'lna', 'wa1', 'wa2', 'warm_cables_return',
+                 'cables_FAAtoGGG', 'cables_GGGto4',
+                 'cables_4to50', 'cables_50to300')
+
     def __init__(self):
 
-        self.ad9082 = hardware_models.AD9082()
+        self.ad9082 = _shared_model(hardware_models.AD9082)
         
         # input attenuation & amplification
-        self.filter_hp = hardware_models.FilterHP_VHF1910p()
-        # self.atten_300K = hardware_models.Attenuator(-10, 300)
-        # self.wa_input = hardware_models.ZX60_3018Gplus()
+        self.filter_hp = _shared_model(hardware_models.FilterHP_VHF1910p)
+        # self.atten_300K = _shared_model(hardware_models.Attenuator, -10, 300)
+        # self.wa_input = _shared_model(hardware_models.ZX60_3018Gplus)
         
         # in cryostat
-        self.atten_4K = hardware_models.Attenuator(-10, 4)
-        self.atten_GGG = hardware_models.Attenuator(0, 0.7)
-        self.atten_FAA = hardware_models.Attenuator(-10, 0.15) 
+        self.atten_4K = _shared_model(hardware_models.Attenuator, -10, 4)
+        self.atten_GGG = _shared_model(hardware_models.Attenuator, 0, 0.7)
+        self.atten_FAA = _shared_model(hardware_models.Attenuator, -10, 0.15) 
         
         # input cables
-        self.warm_cables_in = hardware_models.SMA_FM_F141_cables(length_m=3)
+        self.warm_cables_in = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
         
-        self.cables_300to50 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
-        self.cables_50to4 = hardware_models.SMA_SS219_cryo(length_m=0.5, temperature=4)
-        self.cables_4toGGG = hardware_models.SMA_SS219_cryo(length_m=0.3, temperature=4)
-        self.cables_GGGtoFAA = hardware_models.SMA_SS086_cryo(length_m=0.25, temperature=0.5)
+        self.cables_300to50 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
+        self.cables_50to4 = _shared_model(hardware_models.SMA_SS219_cryo, 0.5, 4)
+        self.cables_4toGGG = _shared_model(hardware_models.SMA_SS219_cryo, 0.3, 4)
+        self.cables_GGGtoFAA = _shared_model(hardware_models.SMA_SS086_cryo, 0.25, 0.5)
         
         
         # return amplifiers etc
-        self.lna = hardware_models.ASU_3GHz_LNA()
-        self.wa1 = hardware_models.ZX60_3018Gplus()
-        self.wa2 = hardware_models.ZX60_3018Gplus()
-        self.warm_cables_return = hardware_models.SMA_FM_F141_cables(length_m=3)
-        
-        self.cables_FAAtoGGG = hardware_models.SMA_NbTi086_cryo(length_m=0.25, temperature=0.3)
-        self.cables_GGGto4 = hardware_models.SMA_NbTi086_cryo(length_m=0.5, temperature=4)
-        self.cables_4to50 = hardware_models.SMA_CuNi086_cryo(length_m=0.5, temperature=50)
-        self.cables_50to300 = hardware_models.SMA_SS086_cryo(length_m=0.3, temperature=300)
+        self.lna = _shared_model(hardware_models.ASU_3GHz_LNA)
+        self.wa1 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.wa2 = _shared_model(hardware_models.ZX60_3018Gplus)
+        self.warm_cables_return = _shared_model(hardware_models.SMA_FM_F141_cables, 3)
         
-#         self.atten_return_warm = hardware_models.Attenuator(-9, 300) ### is this present?
+        self.cables_FAAtoGGG = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.25, 0.3)
+        self.cables_GGGto4 = _shared_model(hardware_models.SMA_NbTi086_cryo, 0.5, 4)
+        self.cables_4to50 = _shared_model(hardware_models.SMA_CuNi086_cryo, 0.5, 50)
+        self.cables_50to300 = _shared_model(hardware_models.SMA_SS086_cryo, 0.3, 300)
         
-    def input_gain(self, carrier_freq):
-        
-        outside_cs_components = self.filter_hp.gain(carrier_freq) #+ self.wa_input.gain(carrier_freq) + self.atten_300K.gain_meas(carrier_freq)
-        
-        inside_cs_components = self.atten_4K.gain_meas(carrier_freq) + self.atten_GGG.gain_meas(carrier_freq) + self.atten_FAA.gain_meas(carrier_freq)
-        
-        cable_gain = self.warm_cables_in.gain(carrier_freq) + self.cables_300to50.gain(carrier_freq) + self.cables_50to4.gain(carrier_freq) + self.cables_4toGGG.gain(carrier_freq) + self.cables_GGGtoFAA.gain(carrier_freq)
-        
-        return outside_cs_components + inside_cs_components + cable_gain
-    
-    
-    def return_gain(self, carrier_freq):
-        
-        amplifier_gain = self.lna.gain(carrier_freq) + self.wa1.gain(carrier_freq) + self.wa2.gain(carrier_freq)
-        cable_gain = self.cables_FAAtoGGG.gain(carrier_freq) + self.cables_GGGto4.gain(carrier_freq) + self.cables_4to50.gain(carrier_freq) + self.cables_50to300.gain(carrier_freq) + self.warm_cables_return.gain(carrier_freq)
-        
-        return amplifier_gain + cable_gain
+#         self.atten_return_warm = _shared_model(hardware_models.Attenuator, -9, 300) ### is this present?
+
+        self._rebuild_gain_luts()
+
+    def _build_chains(self):
+        # fixed evaluation order for the vectorized gain reductions
+        # (no wa_input/atten_300K on this variant; attenuators contribute
+        # their measured gain)
+        self._input_chain = (
+            self.filter_hp.gain,
+            self.atten_4K.gain_meas, self.atten_GGG.gain_meas,
+            self.atten_FAA.gain_meas,
+            self.warm_cables_in.gain, self.cables_300to50.gain,
+            self.cables_50to4.gain, self.cables_4toGGG.gain,
+            self.cables_GGGtoFAA.gain)
+        self._return_chain = (
+            self.lna.gain, self.wa1.gain, self.wa2.gain,
+            self.cables_FAAtoGGG.gain, self.cables_GGGto4.gain,
+            self.cables_4to50.gain, self.cables_50to300.gain,
+            self.warm_cables_return.gain)
     
     
-    def output_noise(self, carrier_freq, spectral_freq, carrier_power_dbm):
-
-        return 0
@@ -8,13 +8,16 @@ signal chains interactively.
 """
 
 import sys
-from PySide6.QtWidgets import QApplication
-
-from gui_components import MainWindow
 
 
 def main():
     """Main application entry point."""
+    # Qt and the component tree are heavyweight imports; defer them so
+    # importing this module (e.g. for discovery) stays cheap
+    from PySide6.QtWidgets import QApplication
+
+    from gui_components import MainWindow
+
     app = QApplication(sys.argv)
     
     # Set application style
@@ -0,0 +1,86 @@
+"""
+Numeric kernels for signal-chain cascade math.
+
+Plain numpy implementations with optional numba compilation, following
+the same pattern as the analog_chains modules: when numba is installed
+the kernels are JIT-compiled (and warmed at import so the first real
+call is fast), otherwise the numpy fallbacks run unchanged.
+"""
+
+import numpy as np
+
+
+def cascade_output_noise(gain_lin, noise_psd):
+    """
+    Propagate per-stage intrinsic noise to the chain output.
+
+    Parameters
+    ----------
+    gain_lin : np.ndarray
+        Linear stage-to-output gains, shape (n_stages,)
+    noise_psd : np.ndarray
+        Intrinsic noise PSDs in W/Hz, shape (n_stages, n_offsets);
+        non-positive entries contribute nothing
+
+    Returns
+    -------
+    np.ndarray
+        Total output noise PSD in W/Hz, shape (n_offsets,)
+    """
+    out = np.zeros(noise_psd.shape[1])
+    for i in range(gain_lin.shape[0]):
+        out += np.where(noise_psd[i] > 0, noise_psd[i] * gain_lin[i], 0.0)
+    return out
+
+
+def sum_gain_rows(rows):
+    """
+    Sum per-component gain rows into the total chain gain.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Per-component gains in dB, shape (n_components, n_freqs)
+
+    Returns
+    -------
+    np.ndarray
+        Total gain in dB, shape (n_freqs,)
+    """
+    return rows.sum(axis=0)
+
+
+try:
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def cascade_output_noise(gain_lin, noise_psd):  # noqa: F811
+        # tight two-level loop, parallel over the offset axis; avoids
+        # the per-stage temporaries of the numpy fallback
+        n_stages, n_offsets = noise_psd.shape
+        out = np.zeros(n_offsets)
+        for j in numba.prange(n_offsets):
+            acc = 0.0
+            for i in range(n_stages):
+                v = noise_psd[i, j]
+                if v > 0.0:
+                    acc += v * gain_lin[i]
+            out[j] = acc
+        return out
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def sum_gain_rows(rows):  # noqa: F811
+        # column-parallel reduction without the axis-sum temporaries
+        n_rows, n_freqs = rows.shape
+        out = np.zeros(n_freqs)
+        for j in numba.prange(n_freqs):
+            acc = 0.0
+            for i in range(n_rows):
+                acc += rows[i, j]
+            out[j] = acc
+        return out
+
+    cascade_output_noise(np.ones(1), np.zeros((1, 1)))
+    sum_gain_rows(np.zeros((1, 1)))
+except ImportError:
+    pass
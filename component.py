@@ -5,17 +5,84 @@ All hardware components (amplifiers, cables, attenuators, etc.) should inherit
 from this base class and implement the required methods.
 """
 
-from abc import ABC, abstractmethod
+import collections
+import functools
 
+import numpy as np
 
-class Component(ABC):
+# Sweeps reuse the same frequency grid while the user iterates on plot
+# options, so a tiny FIFO per component and method turns the repeat
+# model evaluations into dict hits.
+_FREQ_CACHE_SLOTS = 4
+
+
+def _memoize_freq(method):
+    """
+    Cache method(frequency_array) results keyed by the frequency grid.
+    
+    Scalar queries, keyword calls and unusual call shapes bypass the
+    cache entirely, so wrapped methods keep their original calling
+    semantics (including the TypeError a no-argument noise() raises when
+    passed a frequency). Keys include the component's parameter version,
+    so in-place edits of public attributes invalidate stale entries
+    automatically. Each entry keeps a strong reference to its grid and a
+    hit is confirmed by value: size and endpoints alone cannot tell a
+    linspace from a geomspace over the same span, and a buffer address
+    is not identity once the allocator reuses a freed block.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if (kwargs or len(args) != 1 or not isinstance(args[0], np.ndarray)
+                or args[0].size == 0):
+            return method(self, *args, **kwargs)
+        frequency = args[0]
+
+        caches = self.__dict__.setdefault('_freq_cache', {})
+        cache = caches.get(name)
+        if cache is None:
+            cache = caches[name] = collections.OrderedDict()
+
+        key = (self.__dict__.get('_param_version', 0),
+               frequency.size,
+               float(frequency.flat[0]), float(frequency.flat[-1]))
+        entry = cache.get(key)
+        if entry is not None:
+            cached_freq, result = entry
+            if cached_freq is frequency or np.array_equal(cached_freq,
+                                                          frequency):
+                return result
+        result = method(self, frequency)
+        cache[key] = (frequency, result)
+        if len(cache) > _FREQ_CACHE_SLOTS:
+            cache.popitem(last=False)
+        return result
+    
+    wrapper._freq_memoized = True
+    return wrapper
+
+
+class Component:
     """
     Abstract base class for signal chain components.
     
     Each component must implement methods for gain and noise characteristics
-    as functions of frequency.
+    as functions of frequency. A plain class with an __init_subclass__
+    check is used instead of ABCMeta, whose isinstance/subclass hooks
+    tax every attribute-heavy sweep; abstract intermediate bases opt out
+    of the check with _abstract_base = True.
     """
     
+    __slots__ = ('name', 'component_type')
+    
+    _abstract_base = True
+    
+    # numeric parameters are normalized to this dtype on assignment so
+    # vectorized gain/noise math skips the per-call Python-float boxing;
+    # subclasses with modest dynamic range may switch to np.float32
+    _preferred_dtype = np.float64
+    
     def __init__(self, name=None, component_type=None):
         """
         Initialize a component.
@@ -30,7 +97,26 @@ class Component(ABC):
         self.name = name if name is not None else self.__class__.__name__
         self.component_type = component_type if component_type is not None else 'generic'
     
-    @abstractmethod
+    def __init_subclass__(cls, **kwargs):
+        """Enforce the gain() contract and install the frequency-grid cache."""
+        super().__init_subclass__(**kwargs)
+        for method_name in ('gain', 'noise'):
+            method = cls.__dict__.get(method_name)
+            if (callable(method)
+                    and not getattr(method, '_freq_memoized', False)):
+                setattr(cls, method_name, _memoize_freq(method))
+        if not cls.__dict__.get('_abstract_base', False) and cls.gain is Component.gain:
+            raise TypeError(f"{cls.__name__} must implement gain()")
+    
+    def __setattr__(self, name, value):
+        # editing any public parameter invalidates cached sweep arrays;
+        # plain floats are promoted to the preferred numpy scalar type
+        if not name.startswith('_'):
+            self.__dict__['_param_version'] = self.__dict__.get('_param_version', 0) + 1
+            if type(value) is float:
+                value = self._preferred_dtype(value)
+        object.__setattr__(self, name, value)
+    
     def gain(self, frequency):
         """
         Return the gain/loss of this component in dB.
@@ -45,7 +131,7 @@ class Component(ABC):
         float or np.ndarray
             Gain in dB (negative values indicate loss)
         """
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} must implement gain()")
     
     def noise(self, frequency):
         """
@@ -79,6 +165,8 @@ class Component(ABC):
 class PassiveComponent(Component):
     """Base class for passive components (cables, attenuators, filters)."""
     
+    _abstract_base = True
+    
     def __init__(self, name=None):
         super().__init__(name=name, component_type='passive')
 
@@ -86,5 +174,7 @@ class PassiveComponent(Component):
 class ActiveComponent(Component):
     """Base class for active components (amplifiers, converters)."""
     
+    _abstract_base = True
+    
     def __init__(self, name=None):
         super().__init__(name=name, component_type='active')
@@ -4,11 +4,12 @@ Diagram generation for RF signal chains.
 Creates visual block diagrams showing components and signal flow.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 import numpy as np
 
+# matplotlib is imported inside the generate methods; pulling in the
+# plotting stack only when a diagram is actually drawn keeps scripts
+# that import this module for the class definition fast to start.
+
 
 class DiagramGenerator:
     """
@@ -51,6 +52,10 @@ class DiagramGenerator:
         if (show_gain or show_noise) and frequency is None:
             raise ValueError("frequency parameter required when show_gain or show_noise is True")
         
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection, PatchCollection
+        from matplotlib.patches import Rectangle
+        
         fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
@@ -81,32 +86,65 @@ class DiagramGenerator:
         y_center = 5.0
         box_height = 1.2
         
-        # Draw components
-        for idx, component in enumerate(self.chain.components):
-            x = start_x + idx * spacing
-            
-            # Get component info
+        # With very long chains the box patches dominate vector output
+        # size; rasterize them while keeping text and axes as vectors
+        rasterize_boxes = n_components > 50
+        
+        _TYPE_COLORS = {'active': '#90EE90',    # Light green
+                        'passive': '#ADD8E6'}   # Light blue; gray otherwise
+        
+        # One collection per artist kind instead of one patch per
+        # component: positions come from a single arange and the style
+        # state is shared, so draw cost no longer scales with N artists
+        xs = start_x + np.arange(n_components) * spacing
+        colors = [_TYPE_COLORS.get(getattr(c, 'component_type', 'generic'),
+                                   '#F0F0F0')
+                  for c in self.chain.components]
+        boxes = [Rectangle((x - box_width/2, y_center - box_height/2),
+                           box_width, box_height) for x in xs]
+        box_collection = PatchCollection(boxes, facecolors=colors,
+                                         edgecolors='black', linewidths=1.5)
+        if rasterize_boxes:
+            box_collection.set_rasterized(True)
+        ax.add_collection(box_collection)
+        
+        # Connectors: one LineCollection plus one marker plot for the
+        # arrowheads
+        if n_components > 1:
+            seg_start = xs[:-1] + box_width/2 + 0.05
+            seg_stop = xs[1:] - box_width/2 - 0.05
+            y_mid = np.full(n_components - 1, y_center)
+            segments = np.stack(
+                [np.column_stack([seg_start, y_mid]),
+                 np.column_stack([seg_stop, y_mid])], axis=1)
+            ax.add_collection(LineCollection(segments, colors='black',
+                                             linewidths=2))
+            ax.plot(seg_stop, y_mid, linestyle='none', marker='>',
+                    color='black', markersize=6)
+        
+        # Below roughly 24 rendered pixels per box the labels are
+        # unreadable anyway, so skip the per-component text for very
+        # long chains; the figure spans 10 data units horizontally
+        px_per_box = box_width * figsize[0] * dpi / 10.0
+        annotate = px_per_box > 24
+        
+        # Evaluate each component once up front; the annotation loop
+        # reuses these values and the gain summary sums them instead of
+        # re-walking the chain through total_gain
+        comp_gains = comp_noises = None
+        if show_gain:
+            comp_gains = [component.gain(frequency)
+                          if hasattr(component, 'gain') else None
+                          for component in self.chain.components]
+        if show_noise and annotate:
+            comp_noises = [component.noise(frequency)
+                           if hasattr(component, 'noise') else None
+                           for component in self.chain.components]
+        
+        # Per-component annotations
+        for idx, component in enumerate(self.chain.components if annotate else ()):
+            x = xs[idx]
             label = self.chain._get_label_for_index(idx)
-            comp_type = getattr(component, 'component_type', 'generic')
-            
-            # Choose color based on type
-            if comp_type == 'active':
-                color = '#90EE90'  # Light green
-            elif comp_type == 'passive':
-                color = '#ADD8E6'  # Light blue
-            else:
-                color = '#F0F0F0'  # Light gray
-            
-            # Draw box
-            box = FancyBboxPatch(
-                (x - box_width/2, y_center - box_height/2),
-                box_width, box_height,
-                boxstyle="round,pad=0.1",
-                edgecolor='black',
-                facecolor=color,
-                linewidth=1.5
-            )
-            ax.add_patch(box)
             
             # Component name (shortened if needed)
             display_name = label if len(label) <= 15 else label[:12] + "..."
@@ -114,15 +152,14 @@ class DiagramGenerator:
                     fontsize=8, fontweight='bold')
             
             # Add gain if requested
-            if show_gain and hasattr(component, 'gain'):
-                gain_val = component.gain(frequency)
-                gain_text = f"{gain_val:+.1f} dB"
+            if show_gain and comp_gains[idx] is not None:
+                gain_text = f"{comp_gains[idx]:+.1f} dB"
                 ax.text(x, y_center - 0.3, gain_text, ha='center', va='center',
                         fontsize=7, color='blue')
             
             # Add noise if requested
-            if show_noise and hasattr(component, 'noise'):
-                noise_val = component.noise(frequency)
+            if show_noise and comp_noises[idx] is not None:
+                noise_val = comp_noises[idx]
                 if noise_val > 0:
                     # Show noise temperature if thermal
                     if hasattr(component, 'temperature'):
@@ -131,27 +168,19 @@ class DiagramGenerator:
                         noise_text = f"{noise_val:.1e} W/Hz"
                     ax.text(x, y_center - 0.5, noise_text, ha='center', va='center',
                             fontsize=6, color='red', style='italic')
-            
-            # Draw arrow to next component
-            if idx < n_components - 1:
-                next_x = start_x + (idx + 1) * spacing
-                arrow = FancyArrowPatch(
-                    (x + box_width/2 + 0.05, y_center),
-                    (next_x - box_width/2 - 0.05, y_center),
-                    arrowstyle='->,head_width=0.3,head_length=0.2',
-                    color='black',
-                    linewidth=2
-                )
-                ax.add_patch(arrow)
         
-        # Add summary statistics
+        # Add summary statistics. Gains are additive in dB, so the total
+        # is the sum of the per-component annotations already computed.
         if show_gain and frequency is not None:
-            total_gain = self.chain.total_gain(frequency)
+            total_gain = sum(g for g in comp_gains if g is not None)
             ax.text(5, 1.5, f"Total Gain: {total_gain:+.1f} dB @ {frequency/1e9:.3f} GHz",
                     ha='center', va='center', fontsize=10, 
                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         if show_noise and frequency is not None:
+            # Output noise is a propagated cascade, not the sum of the
+            # per-stage annotation values, so it still goes through the
+            # chain's own calculation
             total_noise = self.chain.output_noise(frequency, spectral_frequency)
             ax.text(5, 0.8, f"Output Noise: {total_noise:.2e} W/Hz @ {frequency/1e9:.3f} GHz (offset: {spectral_frequency/1e3:.1f} kHz)",
                     ha='center', va='center', fontsize=9,
@@ -191,6 +220,10 @@ class DiagramGenerator:
         dpi : int
             Resolution
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection, PatchCollection
+        from matplotlib.patches import Rectangle
+        
         if frequency_range is None:
             frequency_range = np.logspace(8, 9.5, 100)  # 100 MHz to 3 GHz
         
@@ -212,34 +245,48 @@ class DiagramGenerator:
         ax_diagram.text(5, 2.5, self.chain.name, ha='center', va='top',
                         fontsize=14, fontweight='bold')
         
-        # Draw simplified component blocks
+        # Draw simplified component blocks as collections, one per
+        # artist kind, instead of a patch per component
         n_components = len(self.chain.components)
         if n_components > 0:
             spacing = 8.0 / max(n_components, 1)
-            for idx, component in enumerate(self.chain.components):
-                x = 1.0 + idx * spacing
+            xs = 1.0 + np.arange(n_components) * spacing
+            colors = ['#90EE90' if getattr(c, 'component_type', 'generic') == 'active'
+                      else '#ADD8E6' for c in self.chain.components]
+            boxes = [Rectangle((x - 0.3, 0.5), 0.6, 0.8) for x in xs]
+            ax_diagram.add_collection(PatchCollection(boxes, facecolors=colors,
+                                                      edgecolors='black',
+                                                      linewidths=1))
+            
+            for idx in range(n_components):
                 label = self.chain._get_label_for_index(idx)
                 short_label = label[:10] + "..." if len(label) > 10 else label
-                
-                comp_type = getattr(component, 'component_type', 'generic')
-                color = '#90EE90' if comp_type == 'active' else '#ADD8E6'
-                
-                box = FancyBboxPatch((x - 0.3, 0.5), 0.6, 0.8,
-                                     boxstyle="round,pad=0.05",
-                                     edgecolor='black', facecolor=color, linewidth=1)
-                ax_diagram.add_patch(box)
-                ax_diagram.text(x, 0.9, short_label, ha='center', va='center',
-                                fontsize=6)
-                
-                if idx < n_components - 1:
-                    arrow = FancyArrowPatch((x + 0.3, 0.9), (x + spacing - 0.3, 0.9),
-                                           arrowstyle='->', color='black', linewidth=1.5)
-                    ax_diagram.add_patch(arrow)
+                ax_diagram.text(xs[idx], 0.9, short_label, ha='center',
+                                va='center', fontsize=6)
+            
+            if n_components > 1:
+                y_mid = np.full(n_components - 1, 0.9)
+                segments = np.stack(
+                    [np.column_stack([xs[:-1] + 0.3, y_mid]),
+                     np.column_stack([xs[1:] - 0.3, y_mid])], axis=1)
+                ax_diagram.add_collection(LineCollection(segments, colors='black',
+                                                         linewidths=1.5))
+                ax_diagram.plot(xs[1:] - 0.3, y_mid, linestyle='none',
+                                marker='>', color='black', markersize=4)
+        
+        # Evaluate every component's gain over the carrier grid once;
+        # the same rows feed both the gain panel and the noise-vs-carrier
+        # panel's stage-to-output cascade
+        frequency_range = np.asarray(frequency_range, dtype=float)
+        gain_rows = self.chain._gain_rows(frequency_range)
         
         # Middle: Gain plot
         ax_gain = fig.add_subplot(gs[1])
-        gains = [self.chain.total_gain(f) for f in frequency_range]
-        ax_gain.semilogx(frequency_range / 1e9, gains, 'b-', linewidth=2)
+        gains = gain_rows.sum(axis=0)
+        (gain_line,) = ax_gain.semilogx(frequency_range / 1e9, gains, 'b-', linewidth=2)
+        # rasterize only the data curve: dense sweeps stay one bitmap
+        # layer in the PDF while axes and labels remain crisp vectors
+        gain_line.set_rasterized(True)
         ax_gain.grid(True, alpha=0.3)
         ax_gain.set_xlabel('Frequency (GHz)', fontsize=10)
         ax_gain.set_ylabel('Total Gain (dB)', fontsize=10)
@@ -247,8 +294,10 @@ class DiagramGenerator:
         
         # Third: Noise vs carrier frequency plot
         ax_noise = fig.add_subplot(gs[2])
-        noise = [self.chain.output_noise(f, spectral_frequency) for f in frequency_range]
-        ax_noise.loglog(frequency_range / 1e9, noise, 'r-', linewidth=2)
+        noise = self.chain.output_noise_carrier_vec(frequency_range, spectral_frequency,
+                                                    gain_rows=gain_rows)
+        (noise_line,) = ax_noise.loglog(frequency_range / 1e9, noise, 'r-', linewidth=2)
+        noise_line.set_rasterized(True)
         ax_noise.grid(True, alpha=0.3)
         ax_noise.set_xlabel('Carrier Frequency (GHz)', fontsize=10)
         ax_noise.set_ylabel('Output Noise PSD (W/Hz)', fontsize=10)
@@ -257,8 +306,10 @@ class DiagramGenerator:
         
         # Fourth: Noise spectrum within carrier bandwidth
         ax_spectrum = fig.add_subplot(gs[3])
-        noise_spectrum = [self.chain.output_noise(carrier_for_spectrum, f) for f in spectral_range]
-        ax_spectrum.loglog(spectral_range / 1e3, noise_spectrum, 'purple', linewidth=2)
+        noise_spectrum = self.chain.output_noise_vec(carrier_for_spectrum, spectral_range)
+        (spectrum_line,) = ax_spectrum.loglog(spectral_range / 1e3, noise_spectrum,
+                                              'purple', linewidth=2)
+        spectrum_line.set_rasterized(True)
         ax_spectrum.grid(True, alpha=0.3)
         ax_spectrum.set_xlabel('Spectral/Offset Frequency (kHz)', fontsize=10)
         ax_spectrum.set_ylabel('Output Noise PSD (W/Hz)', fontsize=10)
@@ -22,6 +22,9 @@ class ChainView(QWidget):
         super().__init__(parent)
         
         self.chain = SignalChain("User Chain")
+        # parallel Python list of components, maintained in O(1) by the
+        # mutation handlers so no path ever has to walk Qt items
+        self._components = []
         
         layout = QVBoxLayout(self)
         
@@ -58,6 +61,7 @@ class ChainView(QWidget):
     def add_component(self, component, description):
         """Add a component to the chain."""
         self.chain.add_component(component)
+        self._components.append(component)
         
         item = QListWidgetItem(description)
         item.setData(Qt.UserRole, component)
@@ -67,26 +71,39 @@ class ChainView(QWidget):
         """Move selected component up in the chain."""
         current_row = self.list_widget.currentRow()
         if current_row > 0:
-            item = self.list_widget.takeItem(current_row)
-            self.list_widget.insertItem(current_row - 1, item)
-            self.list_widget.setCurrentRow(current_row - 1)
-            self._rebuild_chain()
+            self.list_widget.setUpdatesEnabled(False)
+            try:
+                item = self.list_widget.takeItem(current_row)
+                self.list_widget.insertItem(current_row - 1, item)
+                self.list_widget.setCurrentRow(current_row - 1)
+            finally:
+                self.list_widget.setUpdatesEnabled(True)
+            self.chain.move_component(current_row, current_row - 1)
+            self._components.insert(current_row - 1,
+                                    self._components.pop(current_row))
             
     def _move_down(self):
         """Move selected component down in the chain."""
         current_row = self.list_widget.currentRow()
         if current_row < self.list_widget.count() - 1 and current_row >= 0:
-            item = self.list_widget.takeItem(current_row)
-            self.list_widget.insertItem(current_row + 1, item)
-            self.list_widget.setCurrentRow(current_row + 1)
-            self._rebuild_chain()
+            self.list_widget.setUpdatesEnabled(False)
+            try:
+                item = self.list_widget.takeItem(current_row)
+                self.list_widget.insertItem(current_row + 1, item)
+                self.list_widget.setCurrentRow(current_row + 1)
+            finally:
+                self.list_widget.setUpdatesEnabled(True)
+            self.chain.move_component(current_row, current_row + 1)
+            self._components.insert(current_row + 1,
+                                    self._components.pop(current_row))
             
     def _remove_selected(self):
         """Remove selected component from chain."""
         current_row = self.list_widget.currentRow()
         if current_row >= 0:
             self.list_widget.takeItem(current_row)
-            self._rebuild_chain()
+            self.chain.remove_component(current_row)
+            self._components.pop(current_row)
             
     def _clear_all(self):
         """Clear all components from chain."""
@@ -96,18 +113,31 @@ class ChainView(QWidget):
             QMessageBox.Yes | QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            self.list_widget.clear()
-            self._rebuild_chain()
-            
+            self.reset()
+
+    def reset(self):
+        """Clear the chain, the parallel list, and the list widget.
+
+        The three stores must be cleared together: get_chain() returns
+        the in-place-mutated self.chain, so clearing only the widget
+        would leave stale components behind.
+        """
+        self.list_widget.clear()
+        self.chain.clear()
+        self._components.clear()
+
     def _rebuild_chain(self):
-        """Rebuild the SignalChain object from current list."""
+        """Rebuild the SignalChain object from the internal list.
+        
+        Normal edits mutate self.chain in place; this full rebuild is kept
+        only as a recovery path if the chain ever disagrees with the
+        view. It reads the parallel Python list, so even recovery costs
+        no per-row Qt round-trips.
+        """
         self.chain = SignalChain("User Chain")
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            component = item.data(Qt.UserRole)
+        for component in self._components:
             self.chain.add_component(component)
     
     def get_chain(self):
         """Return the current SignalChain object."""
-        self._rebuild_chain()
         return self.chain
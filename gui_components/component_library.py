@@ -4,77 +4,140 @@ Component Library Widget
 Displays available hardware components organized by category.
 """
 
-import inspect
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem
-from PySide6.QtCore import Qt, Signal
+import functools
+import re
+
+from PySide6.QtWidgets import QTreeView
+from PySide6.QtCore import Qt, Signal, QAbstractItemModel, QModelIndex
 
 import hardware_models
 
+# Scan hardware_models once at import; a plain dict comprehension over
+# __dict__ gives the same public classes as inspect.getmembers without
+# the per-instantiation inspect overhead.
+_COMPONENT_CLASSES = {
+    name: obj for name, obj in hardware_models.__dict__.items()
+    if isinstance(obj, type) and not name.startswith('_')
+}
+
+# Category rules as precompiled alternations, checked in order: one
+# regex scan per class name instead of a cascade of substring tests.
+CATEGORY_PATTERNS = [
+    ("Amplifiers", re.compile(r"LNA|AMP|^ZX|^ASU", re.I)),
+    ("Cables", re.compile(r"cable|SMA|BCB|RG", re.I)),
+    ("Attenuators", re.compile(r"Attenuator")),
+    ("Filters", re.compile(r"Filter")),
+    ("Converters", re.compile(r"AD9082|DAC|ADC")),
+]
 
-class ComponentLibrary(QTreeWidget):
+
+@functools.lru_cache(maxsize=None)
+def _discover_components():
+    """Categorize the hardware-model classes, once per process.
+    
+    Every ComponentLibrary instance shares the result, so constructing
+    additional library widgets costs only the model wiring.
     """
-    Tree widget displaying available hardware components organized by type.
+    categories = {
+        "Amplifiers": [],
+        "Cables": [],
+        "Attenuators": [],
+        "Filters": [],
+        "Converters": [],
+        "Other": []
+    }
+    for name, obj in _COMPONENT_CLASSES.items():
+        category = next((cat for cat, pattern in CATEGORY_PATTERNS
+                         if pattern.search(name)), "Other")
+        categories[category].append((name, obj))
+    return categories
+
+
+class ComponentLibraryModel(QAbstractItemModel):
     """
-    
+    Read-only two-level model over the category -> component-class dict.
+
+    The model owns plain Python data and the view only materializes
+    visible rows, so there is no per-item widget allocation at startup.
+    Indexes carry the parent category row (+1) as their internalId;
+    category rows use id 0.
+    """
+
+    def __init__(self, categories, parent=None):
+        super().__init__(parent)
+        self._categories = [
+            (category, sorted(components, key=lambda x: x[0]))
+            for category, components in categories.items()
+            if components
+        ]
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._categories)
+        if parent.internalId() == 0:
+            return len(self._categories[parent.row()][1])
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        parent_id = index.internalId()
+        if parent_id == 0:
+            if role == Qt.DisplayRole:
+                return self._categories[index.row()][0]
+            return None
+        category, components = self._categories[parent_id - 1]
+        name, comp_class = components[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.UserRole:
+            return (category, comp_class)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Component Library"
+        return None
+
+
+class ComponentLibrary(QTreeView):
+    """
+    Tree view displaying available hardware components organized by type.
+    """
+
     component_selected = Signal(str, object)  # Signal emitting (category, class)
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        
-        self.setHeaderLabel("Component Library")
-        self.setColumnCount(1)
-        
-        # Component categories
-        self.categories = {
-            "Amplifiers": [],
-            "Cables": [],
-            "Attenuators": [],
-            "Filters": [],
-            "Converters": [],
-            "Other": []
-        }
-        
-        self._populate_library()
-        self.itemClicked.connect(self._on_item_clicked)
-        
-    def _populate_library(self):
-        """Scan hardware_models module and categorize components."""
-        
-        # Get all classes from hardware_models
-        for name, obj in inspect.getmembers(hardware_models, inspect.isclass):
-            if name.startswith('_'):
-                continue
-                
-            # Categorize based on naming conventions
-            if 'LNA' in name or 'Amp' in name.upper() or name.startswith('ZX') or name.startswith('ASU'):
-                self.categories["Amplifiers"].append((name, obj))
-            elif 'cable' in name.lower() or 'SMA' in name or 'BCB' in name or 'RG' in name:
-                self.categories["Cables"].append((name, obj))
-            elif 'Attenuator' in name:
-                self.categories["Attenuators"].append((name, obj))
-            elif 'Filter' in name:
-                self.categories["Filters"].append((name, obj))
-            elif 'AD9082' in name or 'DAC' in name or 'ADC' in name:
-                self.categories["Converters"].append((name, obj))
-            else:
-                self.categories["Other"].append((name, obj))
-        
-        # Build tree structure
-        for category, components in self.categories.items():
-            if not components:
-                continue
-                
-            category_item = QTreeWidgetItem(self, [category])
-            category_item.setExpanded(True)
-            
-            for comp_name, comp_class in sorted(components, key=lambda x: x[0]):
-                comp_item = QTreeWidgetItem(category_item, [comp_name])
-                comp_item.setData(0, Qt.UserRole, comp_class)
-                
-    def _on_item_clicked(self, item, column):
+
+        self.setUniformRowHeights(True)
+
+        # Component categories, discovered once and shared process-wide
+        self.categories = _discover_components()
+
+        self._model = ComponentLibraryModel(self.categories, self)
+        self.setModel(self._model)
+        self.expandAll()
+
+        self.clicked.connect(self._on_clicked)
+
+    def _on_clicked(self, index):
         """Handle item selection."""
-        comp_class = item.data(0, Qt.UserRole)
-        if comp_class is not None:
+        payload = self._model.data(index, Qt.UserRole)
+        if payload is not None:
             # This is a component, not a category
-            category = item.parent().text(0)
+            category, comp_class = payload
             self.component_selected.emit(category, comp_class)
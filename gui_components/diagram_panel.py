@@ -4,17 +4,58 @@ Diagram Panel
 Embeddable widget for displaying signal chain diagrams.
 """
 
-import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
-from matplotlib.figure import Figure
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+import io
+import weakref
+from collections import namedtuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout,
     QPushButton, QDoubleSpinBox, QCheckBox, QMessageBox, QFileDialog, QLabel
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+
+from .io_jobs import submit_save
+
+# Per-component caches of scalar gain/noise lookups, weakly keyed so
+# components dropped from the chain can still be garbage collected.
+# Redraws at an already-seen frequency skip the model evaluation.
+_GAIN_CACHE = weakref.WeakKeyDictionary()
+_NOISE_CACHE = weakref.WeakKeyDictionary()
+
+
+def _cached_eval(cache, component, method, frequency):
+    values = cache.get(component)
+    if values is None:
+        values = cache[component] = {}
+    if frequency not in values:
+        values[frequency] = getattr(component, method)(frequency)
+    return values[frequency]
+
+
+def _cached_gain(component, frequency):
+    return _cached_eval(_GAIN_CACHE, component, 'gain', frequency)
+
+
+def _cached_noise(component, frequency):
+    return _cached_eval(_NOISE_CACHE, component, 'noise', frequency)
+
+
+# Capability flags per component, probed once instead of re-running the
+# hasattr/getattr machinery on every redraw pass.
+_ComponentCaps = namedtuple('_ComponentCaps',
+                            'comp_type has_gain has_noise has_temp')
+_CAPS_CACHE = weakref.WeakKeyDictionary()
+
+
+def _component_caps(component):
+    caps = _CAPS_CACHE.get(component)
+    if caps is None:
+        caps = _CAPS_CACHE[component] = _ComponentCaps(
+            getattr(component, 'component_type', 'generic'),
+            hasattr(component, 'gain'),
+            hasattr(component, 'noise'),
+            hasattr(component, 'temperature'))
+    return caps
 
 
 class DiagramPanel(QWidget):
@@ -26,6 +67,15 @@ class DiagramPanel(QWidget):
         super().__init__(parent)
         
         self.chain = None
+        self._initialized = False
+        # geometry signature of the last built diagram plus the cached
+        # per-component value artists, so frequency changes only retext
+        self._diagram_sig = None
+        self._last_sig = None
+        self._gain_texts = []
+        self._noise_texts = []
+        self._total_gain_text = None
+        self._total_noise_text = None
         self._setup_ui()
         
     def _setup_ui(self):
@@ -62,6 +112,16 @@ class DiagramPanel(QWidget):
         param_group.setLayout(param_layout)
         left_layout.addWidget(param_group)
         
+        # Coalesce rapid option changes (spinbox drags emit many
+        # valueChanged signals) into one redraw after 50 ms of quiet
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(50)
+        self._redraw_timer.timeout.connect(self.generate_diagram)
+        self.frequency_spin.valueChanged.connect(self._schedule_redraw)
+        self.show_gain_check.toggled.connect(self._schedule_redraw)
+        self.show_noise_check.toggled.connect(self._schedule_redraw)
+        
         # Buttons in left column
         generate_button = QPushButton("Generate Diagram")
         generate_button.clicked.connect(self.generate_diagram)
@@ -81,7 +141,14 @@ class DiagramPanel(QWidget):
         right_layout = QVBoxLayout(right_widget)
         right_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Matplotlib figure
+        # Matplotlib figure; the import is deferred to first
+        # construction so this module stays cheap to import
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from matplotlib.backends.backend_qt5agg import (
+            FigureCanvasQTAgg, NavigationToolbar2QT)
+        from matplotlib.figure import Figure
+        
         self.figure = Figure(figsize=(10, 5))
         self.canvas = FigureCanvasQTAgg(self.figure)
         self.toolbar = NavigationToolbar2QT(self.canvas, self)
@@ -93,17 +160,33 @@ class DiagramPanel(QWidget):
         main_layout.addWidget(left_widget)
         main_layout.addWidget(right_widget)
         
-        # Show empty state initially
-        self._show_empty_state()
+    def showEvent(self, event):
+        """Draw the initial canvas content only once the panel is shown.
+        
+        The first matplotlib draw is deferred to the next event-loop tick
+        so the widget paints immediately instead of blocking on it.
+        """
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            QTimer.singleShot(0, self._show_empty_state)
         
     def set_chain(self, chain):
         """Set the signal chain to display."""
         self.chain = chain
         
+    def _schedule_redraw(self, *args):
+        """(Re)start the debounce timer; only the last change in a burst
+        triggers generate_diagram."""
+        if self.chain is not None and len(self.chain.components) > 0:
+            self._redraw_timer.start()
+        
     def generate_diagram(self):
         """Generate and display the diagram."""
         if self.chain is None or len(self.chain.components) == 0:
             self._show_empty_state()
+            self._diagram_sig = None
+            self._last_sig = None
             return
             
         try:
@@ -111,121 +194,191 @@ class DiagramPanel(QWidget):
             show_gain = self.show_gain_check.isChecked()
             show_noise = self.show_noise_check.isChecked()
             
-            # Clear figure
-            self.figure.clear()
-            
-            # Get axis
-            ax = self.figure.add_subplot(111)
-            ax.set_xlim(0, 10)
-            ax.set_ylim(0, 10)
-            ax.axis('off')
+            # Nothing at all changed since the last render? Skip the
+            # whole pass -- repeat clicks are free.
+            full_sig = (id(self.chain),
+                        tuple(id(c) for c in self.chain.components),
+                        frequency, show_gain, show_noise)
+            if full_sig == self._last_sig:
+                return
             
-            # Title
-            ax.text(5, 9.5, self.chain.name, ha='center', va='top', 
-                    fontsize=16, fontweight='bold')
+            # Same chain layout and toggles as the last build? Then only
+            # the displayed values change with frequency.
+            sig = (id(self.chain),
+                   tuple(self.chain._get_label_for_index(i)
+                         for i in range(len(self.chain.components))),
+                   show_gain, show_noise)
+            if sig == self._diagram_sig:
+                self._update_diagram(frequency, show_gain, show_noise)
+            else:
+                self._build_diagram(frequency, show_gain, show_noise)
+                self._diagram_sig = sig
+            self._last_sig = full_sig
             
-            n_components = len(self.chain.components)
+        except Exception as e:
+            QMessageBox.critical(self, "Generation Error", 
+                               f"Failed to generate diagram:\n{str(e)}")
+    
+    def _get_axes(self):
+        """Return the diagram axes, creating them on first use.
+        
+        Rebuilds go through ax.cla() on the one persistent Axes instead
+        of figure.clear() + add_subplot, which tears down and recreates
+        the whole axes machinery on every layout change.
+        """
+        if self.figure.axes:
+            ax = self.figure.axes[0]
+            ax.cla()
+        else:
+            ax = self.figure.add_subplot(111)
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        ax.axis('off')
+        return ax
+    
+    def _build_diagram(self, frequency, show_gain, show_noise):
+        """Build the full diagram from scratch, caching the value artists."""
+        from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+        
+        self._gain_texts = []
+        self._noise_texts = []
+        self._total_gain_text = None
+        self._total_noise_text = None
+        
+        ax = self._get_axes()
+        
+        # Title
+        ax.text(5, 9.5, self.chain.name, ha='center', va='top', 
+                fontsize=16, fontweight='bold')
+        
+        n_components = len(self.chain.components)
+        
+        # Calculate layout
+        box_width = 8.0 / max(n_components, 1)
+        box_width = min(box_width, 1.5)  # Max width
+        spacing = 8.0 / max(n_components - 1, 1) if n_components > 1 else 0
+        
+        start_x = 1.0
+        y_center = 5.0
+        box_height = 1.2
+        
+        # Draw components
+        for idx, component in enumerate(self.chain.components):
+            x = start_x + idx * spacing
             
-            # Calculate layout
-            box_width = 8.0 / max(n_components, 1)
-            box_width = min(box_width, 1.5)  # Max width
-            spacing = 8.0 / max(n_components - 1, 1) if n_components > 1 else 0
+            # Get component info
+            label = self.chain._get_label_for_index(idx)
+            caps = _component_caps(component)
+            comp_type = caps.comp_type
             
-            start_x = 1.0
-            y_center = 5.0
-            box_height = 1.2
+            # Choose color based on type
+            if comp_type == 'active':
+                color = '#90EE90'  # Light green
+            elif comp_type == 'passive':
+                color = '#ADD8E6'  # Light blue
+            else:
+                color = '#F0F0F0'  # Light gray
             
-            # Draw components
-            for idx, component in enumerate(self.chain.components):
-                x = start_x + idx * spacing
-                
-                # Get component info
-                label = self.chain._get_label_for_index(idx)
-                comp_type = getattr(component, 'component_type', 'generic')
-                
-                # Choose color based on type
-                if comp_type == 'active':
-                    color = '#90EE90'  # Light green
-                elif comp_type == 'passive':
-                    color = '#ADD8E6'  # Light blue
-                else:
-                    color = '#F0F0F0'  # Light gray
-                
-                # Draw box
-                box = FancyBboxPatch(
-                    (x - box_width/2, y_center - box_height/2),
-                    box_width, box_height,
-                    boxstyle="round,pad=0.1",
-                    edgecolor='black',
-                    facecolor=color,
-                    linewidth=1.5
-                )
-                ax.add_patch(box)
-                
-                # Component name (shortened if needed)
-                display_name = label if len(label) <= 15 else label[:12] + "..."
-                ax.text(x, y_center + 0.1, display_name, ha='center', va='center',
-                        fontsize=8, fontweight='bold')
-                
-                # Add gain if requested
-                if show_gain and hasattr(component, 'gain'):
-                    gain_val = component.gain(frequency)
-                    gain_text = f"{gain_val:+.1f} dB"
-                    ax.text(x, y_center - 0.3, gain_text, ha='center', va='center',
-                            fontsize=7, color='blue')
-                
-                # Add noise if requested
-                if show_noise and hasattr(component, 'noise'):
-                    noise_val = component.noise(frequency)
-                    if noise_val > 0:
-                        # Show noise temperature if thermal
-                        if hasattr(component, 'temperature'):
-                            noise_text = f"T={component.temperature}K"
-                        else:
-                            noise_text = f"{noise_val:.1e} W/Hz"
-                        ax.text(x, y_center - 0.5, noise_text, ha='center', va='center',
-                                fontsize=6, color='red', style='italic')
-                
-                # Draw arrow to next component
-                if idx < n_components - 1:
-                    next_x = start_x + (idx + 1) * spacing
-                    arrow = FancyArrowPatch(
-                        (x + box_width/2 + 0.05, y_center),
-                        (next_x - box_width/2 - 0.05, y_center),
-                        arrowstyle='->,head_width=0.3,head_length=0.2',
-                        color='black',
-                        linewidth=2
-                    )
-                    ax.add_patch(arrow)
+            # Draw box
+            box = FancyBboxPatch(
+                (x - box_width/2, y_center - box_height/2),
+                box_width, box_height,
+                boxstyle="round,pad=0.1",
+                edgecolor='black',
+                facecolor=color,
+                linewidth=1.5
+            )
+            ax.add_patch(box)
             
-            # Add summary statistics
-            if show_gain:
-                total_gain = self.chain.total_gain(frequency)
-                ax.text(5, 1.5, f"Total Gain: {total_gain:+.1f} dB @ {frequency/1e9:.3f} GHz",
-                        ha='center', va='center', fontsize=10, 
-                        bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+            # Component name (shortened if needed)
+            display_name = label if len(label) <= 15 else label[:12] + "..."
+            ax.text(x, y_center + 0.1, display_name, ha='center', va='center',
+                    fontsize=8, fontweight='bold')
             
-            if show_noise:
-                spectral_frequency = 1e3  # 1 kHz offset
-                total_noise = self.chain.output_noise(frequency, spectral_frequency)
-                ax.text(5, 0.8, f"Output Noise: {total_noise:.2e} W/Hz @ {frequency/1e9:.3f} GHz (offset: {spectral_frequency/1e3:.1f} kHz)",
-                        ha='center', va='center', fontsize=9,
-                        bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
+            # Add gain if requested
+            gain_artist = None
+            if show_gain and caps.has_gain:
+                gain_val = _cached_gain(component, frequency)
+                gain_text = f"{gain_val:+.1f} dB"
+                gain_artist = ax.text(x, y_center - 0.3, gain_text,
+                                      ha='center', va='center',
+                                      fontsize=7, color='blue')
+            self._gain_texts.append(gain_artist)
             
-            self.figure.tight_layout()
-            self.canvas.draw()
+            # Add noise if requested
+            noise_artist = None
+            if show_noise and caps.has_noise:
+                noise_val = _cached_noise(component, frequency)
+                # Show noise temperature if thermal
+                if caps.has_temp:
+                    noise_text = f"T={component.temperature}K"
+                elif noise_val > 0:
+                    noise_text = f"{noise_val:.1e} W/Hz"
+                else:
+                    noise_text = ""
+                noise_artist = ax.text(x, y_center - 0.5, noise_text,
+                                       ha='center', va='center',
+                                       fontsize=6, color='red', style='italic')
+            self._noise_texts.append(noise_artist)
             
-        except Exception as e:
-            QMessageBox.critical(self, "Generation Error", 
-                               f"Failed to generate diagram:\n{str(e)}")
+            # Draw arrow to next component
+            if idx < n_components - 1:
+                next_x = start_x + (idx + 1) * spacing
+                arrow = FancyArrowPatch(
+                    (x + box_width/2 + 0.05, y_center),
+                    (next_x - box_width/2 - 0.05, y_center),
+                    arrowstyle='->,head_width=0.3,head_length=0.2',
+                    color='black',
+                    linewidth=2
+                )
+                ax.add_patch(arrow)
+        
+        # Add summary statistics
+        if show_gain:
+            total_gain = self.chain.total_gain(frequency)
+            self._total_gain_text = ax.text(
+                5, 1.5, f"Total Gain: {total_gain:+.1f} dB @ {frequency/1e9:.3f} GHz",
+                ha='center', va='center', fontsize=10, 
+                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+        
+        if show_noise:
+            spectral_frequency = 1e3  # 1 kHz offset
+            total_noise = self.chain.output_noise(frequency, spectral_frequency)
+            self._total_noise_text = ax.text(
+                5, 0.8, f"Output Noise: {total_noise:.2e} W/Hz @ {frequency/1e9:.3f} GHz (offset: {spectral_frequency/1e3:.1f} kHz)",
+                ha='center', va='center', fontsize=9,
+                bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
+        
+        self.figure.tight_layout()
+        self.canvas.draw()
+    
+    def _update_diagram(self, frequency, show_gain, show_noise):
+        """Refresh only the frequency-dependent values on cached artists."""
+        for component, gain_artist, noise_artist in zip(
+                self.chain.components, self._gain_texts, self._noise_texts):
+            if gain_artist is not None:
+                gain_artist.set_text(f"{_cached_gain(component, frequency):+.1f} dB")
+            if noise_artist is not None and not _component_caps(component).has_temp:
+                noise_val = _cached_noise(component, frequency)
+                noise_artist.set_text(
+                    f"{noise_val:.1e} W/Hz" if noise_val > 0 else "")
+        
+        if show_gain and self._total_gain_text is not None:
+            total_gain = self.chain.total_gain(frequency)
+            self._total_gain_text.set_text(
+                f"Total Gain: {total_gain:+.1f} dB @ {frequency/1e9:.3f} GHz")
+        
+        if show_noise and self._total_noise_text is not None:
+            spectral_frequency = 1e3  # 1 kHz offset
+            total_noise = self.chain.output_noise(frequency, spectral_frequency)
+            self._total_noise_text.set_text(
+                f"Output Noise: {total_noise:.2e} W/Hz @ {frequency/1e9:.3f} GHz (offset: {spectral_frequency/1e3:.1f} kHz)")
+        
+        self.canvas.draw_idle()
     
     def _show_empty_state(self):
         """Show empty state message."""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 10)
-        ax.axis('off')
+        ax = self._get_axes()
         ax.text(5, 5, "Add components to the chain and click\n'Generate Diagram' to see the chain diagram here.",
                 ha='center', va='center', fontsize=12, style='italic', color='gray')
         self.canvas.draw()
@@ -245,7 +398,25 @@ class DiagramPanel(QWidget):
             return
         
         try:
-            self.figure.savefig(file_path, dpi=300, bbox_inches='tight')
-            QMessageBox.information(self, "Success", f"Diagram saved to:\n{file_path}")
+            # the figure is not thread-safe, so render to memory on the
+            # GUI thread; only the byte write goes to the thread pool.
+            # Vector formats carry no raster, so skip the dpi knob; for
+            # raster output 150 dpi is plenty for screen-sized figures
+            # and avoids the extra measuring render of bbox_inches
+            fmt = file_path.rsplit('.', 1)[-1].lower() if '.' in file_path else 'pdf'
+            buffer = io.BytesIO()
+            if fmt in ('pdf', 'svg'):
+                self.figure.savefig(buffer, format=fmt, bbox_inches='tight')
+            else:
+                self.figure.savefig(buffer, format=fmt, dpi=150)
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Failed to save diagram:\n{str(e)}")
+            return
+        
+        data = buffer.getvalue()
+        
+        def _write():
+            with open(file_path, 'wb') as f:
+                f.write(data)
+        
+        submit_save(self, _write, f"Diagram saved to:\n{file_path}", "Save Error")
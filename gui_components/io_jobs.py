@@ -0,0 +1,67 @@
+"""
+Background file-writing jobs for the GUI panels.
+
+Export and save operations write files on the global thread pool so a
+large CSV or PNG never stalls paint events; completion and errors come
+back to the GUI thread via signals.
+"""
+
+from PySide6.QtWidgets import QMessageBox
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# Keep submitted jobs referenced until their signals have fired;
+# otherwise a collected sender can drop the queued completion message.
+_ACTIVE_JOBS = set()
+
+
+class _SaveSignals(QObject):
+    finished = Signal()
+    failed = Signal(str)
+
+
+class SaveJob(QRunnable):
+    """Runs a file-writing callable off the GUI thread."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.signals = _SaveSignals()
+        self._fn = fn
+
+    def run(self):
+        try:
+            self._fn()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit()
+
+
+def submit_save(parent, fn, success_message, error_title):
+    """
+    Run fn on the thread pool and report the outcome in a message box.
+
+    Parameters
+    ----------
+    parent : QWidget
+        Parent for the completion/error message boxes
+    fn : callable
+        The file-writing work; runs off the GUI thread
+    success_message : str
+        Text for the information box shown on success
+    error_title : str
+        Title for the critical box shown on failure
+    """
+    job = SaveJob(fn)
+    _ACTIVE_JOBS.add(job)
+
+    def _done():
+        _ACTIVE_JOBS.discard(job)
+        QMessageBox.information(parent, "Success", success_message)
+
+    def _failed(message):
+        _ACTIVE_JOBS.discard(job)
+        QMessageBox.critical(parent, error_title, message)
+
+    job.signals.finished.connect(_done)
+    job.signals.failed.connect(_failed)
+    QThreadPool.globalInstance().start(job)
@@ -6,6 +6,7 @@ Main application window for the Analog Chain Builder.
 
 import sys
 import json
+import functools
 import inspect
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
@@ -16,6 +17,13 @@ from PySide6.QtGui import QAction
 
 import hardware_models
 
+# inspect.signature re-parses defaults and annotations on every call;
+# saving a long chain hits every component, so memoize per class.
+@functools.lru_cache(maxsize=None)
+def _init_param_names(cls):
+    return [p for p in inspect.signature(cls.__init__).parameters if p != 'self']
+
+
 from .component_library import ComponentLibrary
 from .chain_view import ChainView
 from .parameter_panel import ParameterPanel
@@ -228,8 +236,7 @@ class MainWindow(QMainWindow):
             }
             
             # Try to extract parameters from component attributes
-            sig = inspect.signature(component.__class__.__init__)
-            for param_name in list(sig.parameters.keys())[1:]:
+            for param_name in _init_param_names(component.__class__):
                 if hasattr(component, param_name):
                     value = getattr(component, param_name)
                     # Only save serializable types
@@ -259,8 +266,9 @@ class MainWindow(QMainWindow):
             with open(file_path, 'r') as f:
                 chain_data = json.load(f)
             
-            # Clear current chain
-            self.chain_view.list_widget.clear()
+            # Clear current chain (widget, SignalChain and parallel
+            # list together -- get_chain() returns the live chain)
+            self.chain_view.reset()
             
             # Rebuild chain
             for comp_info in chain_data:
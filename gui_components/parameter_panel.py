@@ -11,6 +11,43 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Signal
 
+# Signature introspection is slow enough to stall a component click;
+# cache the parameter lists (minus 'self') per class after first use.
+_SIGNATURE_CACHE = {}
+
+
+def _configure_temperature_widget(widget, default_value):
+    widget.setRange(0, 400)
+    widget.setSingleStep(1.0)
+    widget.setValue(default_value if default_value is not None else 300)
+    widget.setSuffix(" K")
+
+
+def _configure_length_widget(widget, default_value):
+    widget.setRange(0, 100)
+    widget.setSingleStep(0.1)
+    widget.setValue(default_value if default_value is not None else 1.0)
+    widget.setSuffix(" m")
+
+
+def _configure_attenuation_widget(widget, default_value):
+    widget.setRange(-100, 0)
+    widget.setSingleStep(1.0)
+    widget.setValue(default_value if default_value is not None else -3.0)
+    widget.setSuffix(" dB")
+
+
+# Widget configuration keyed by parameter-name substring, checked in
+# order; one lowercase pass per parameter instead of an if/elif chain
+# that re-lowercases the name at every branch. The configurators fully
+# reset range, step, value and suffix so pooled spinboxes carry no
+# state over from their previous parameter.
+WIDGET_FACTORIES = {
+    'temperature': _configure_temperature_widget,
+    'length': _configure_length_widget,
+    'attenuation': _configure_attenuation_widget,
+}
+
 
 class ParameterPanel(QWidget):
     """
@@ -25,6 +62,15 @@ class ParameterPanel(QWidget):
         self.current_class = None
         self.param_widgets = {}
         
+        # Pools of reusable row widgets: Qt spinboxes and line edits are
+        # heavyweight to construct, so browsing the library re-shows
+        # pooled widgets instead of delete-and-recreate per click
+        self._spin_pool = []
+        self._line_pool = []
+        self._label_pool = []
+        self._param_rows = []
+        self._info_label = None
+        
         layout = QVBoxLayout(self)
         
         # Group box for parameters
@@ -53,68 +99,79 @@ class ParameterPanel(QWidget):
         self.current_class = comp_class
         self.param_widgets.clear()
         
-        # Clear existing parameter widgets
-        while self.form_layout.rowCount() > 1:
-            self.form_layout.removeRow(1)
+        # Return existing parameter rows to the pools
+        self._clear_param_rows()
         
         # Update label
         self.selected_label.setText(comp_class.__name__)
         
-        # Inspect __init__ signature
-        sig = inspect.signature(comp_class.__init__)
-        params = list(sig.parameters.items())[1:]  # Skip 'self'
+        # Inspect __init__ signature (cached after the first click)
+        if comp_class not in _SIGNATURE_CACHE:
+            sig = inspect.signature(comp_class.__init__)
+            _SIGNATURE_CACHE[comp_class] = list(sig.parameters.items())[1:]  # Skip 'self'
+        params = _SIGNATURE_CACHE[comp_class]
         
         if not params:
             # No parameters needed
-            info_label = QLabel("(No parameters required)")
-            info_label.setStyleSheet("color: #777; font-style: italic;")
-            self.form_layout.addRow(info_label)
+            if self._info_label is None:
+                self._info_label = QLabel("(No parameters required)")
+                self._info_label.setStyleSheet("color: #777; font-style: italic;")
+            self.form_layout.addRow(self._info_label)
+            self._info_label.show()
             self.add_button.setEnabled(True)
             return
         
-        # Create input widgets based on parameter names and defaults
+        # Configure input widgets based on parameter names and defaults
         for param_name, param in params:
             widget = self._create_widget_for_parameter(param_name, param)
             if widget:
                 self.param_widgets[param_name] = widget
-                label = param_name.replace('_', ' ').title()
-                self.form_layout.addRow(f"{label}:", widget)
+                text = param_name.replace('_', ' ').title()
+                label = (self._label_pool.pop() if self._label_pool else QLabel())
+                label.setText(f"{text}:")
+                self.form_layout.addRow(label, widget)
+                label.show()
+                widget.show()
+                self._param_rows.append((label, widget))
         
         self.add_button.setEnabled(True)
+    
+    def _clear_param_rows(self):
+        """Detach the current parameter rows and pool their widgets."""
+        if self._info_label is not None and self._info_label.isVisible():
+            self.form_layout.takeRow(self._info_label)
+            self._info_label.hide()
+        
+        for label, field in self._param_rows:
+            self.form_layout.takeRow(field)
+            label.hide()
+            field.hide()
+            self._label_pool.append(label)
+            if isinstance(field, QDoubleSpinBox):
+                self._spin_pool.append(field)
+            else:
+                self._line_pool.append(field)
+        self._param_rows = []
         
     def _create_widget_for_parameter(self, param_name, param):
         """Create appropriate input widget for a parameter."""
-        default_value = param.default if param.default != inspect.Parameter.empty else None
-        
-        # Determine widget type based on name and default
-        if 'temperature' in param_name.lower():
-            widget = QDoubleSpinBox()
-            widget.setRange(0, 400)
-            widget.setValue(default_value if default_value is not None else 300)
-            widget.setSuffix(" K")
-            return widget
-            
-        elif 'length' in param_name.lower():
-            widget = QDoubleSpinBox()
-            widget.setRange(0, 100)
-            widget.setValue(default_value if default_value is not None else 1.0)
-            widget.setSingleStep(0.1)
-            widget.setSuffix(" m")
-            return widget
-            
-        elif 'attenuation' in param_name.lower():
-            widget = QDoubleSpinBox()
-            widget.setRange(-100, 0)
-            widget.setValue(default_value if default_value is not None else -3.0)
-            widget.setSuffix(" dB")
-            return widget
-            
-        else:
-            # Generic numeric or text input
-            widget = QLineEdit()
-            if default_value is not None:
-                widget.setText(str(default_value))
-            return widget
+        empty = inspect.Parameter.empty
+        default_value = param.default if param.default != empty else None
+        
+        # Determine widget type based on name and default; reuse pooled
+        # widgets where possible
+        lname = param_name.lower()
+        for key, configure in WIDGET_FACTORIES.items():
+            if key in lname:
+                widget = (self._spin_pool.pop() if self._spin_pool
+                          else QDoubleSpinBox())
+                configure(widget, default_value)
+                return widget
+        
+        # Generic numeric or text input
+        widget = self._line_pool.pop() if self._line_pool else QLineEdit()
+        widget.setText(str(default_value) if default_value is not None else "")
+        return widget
     
     def _on_add_clicked(self):
         """Emit signal with component and parameters."""
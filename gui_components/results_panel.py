@@ -4,17 +4,132 @@ Results Panel
 Embeddable widget for displaying gain and noise analysis results.
 """
 
+import functools
+import io
+
 import numpy as np
-import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
-from matplotlib.figure import Figure
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout,
     QPushButton, QDoubleSpinBox, QSpinBox, QComboBox, QCheckBox, QLabel,
     QMessageBox, QFileDialog
 )
+from PySide6.QtCore import QTimer, QObject, QRunnable, QThreadPool, Signal
+
+from .io_jobs import submit_save
+
+
+# Plotting more vertices than the canvas has pixel columns only slows
+# the Agg render; dense sweeps are decimated to per-bucket min/max
+# pairs, which preserves the visual envelope of a PSD curve exactly.
+_MAX_DRAW_POINTS = 2000
+
+
+def _minmax_decimate(x, y, n_buckets):
+    """Downsample (x, y) to at most two points per bucket: the bucket's
+    minimum and maximum, in index order."""
+    edges = np.linspace(0, x.size, n_buckets + 1).astype(int)
+    xs = []
+    ys = []
+    for i in range(n_buckets):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            continue
+        j_min = lo + np.argmin(y[lo:hi])
+        j_max = lo + np.argmax(y[lo:hi])
+        j0, j1 = (j_min, j_max) if j_min <= j_max else (j_max, j_min)
+        xs.append(x[j0])
+        ys.append(y[j0])
+        if j1 != j0:
+            xs.append(x[j1])
+            ys.append(y[j1])
+    return np.asarray(xs), np.asarray(ys)
+
+
+def _draw_data(x, y):
+    """Return (x, y) capped at _MAX_DRAW_POINTS vertices for display;
+    the full-resolution arrays are kept for export."""
+    if x.size <= _MAX_DRAW_POINTS:
+        return x, y
+    return _minmax_decimate(x, y, _MAX_DRAW_POINTS // 2)
+
+
+# Sweep grids keyed by their parameters; users iterate on plot options
+# far more often than on the ranges, so repeat runs reuse the array.
+_GRID_CACHE = {}
+
+
+def _freq_grid(start, stop, num_points, is_log):
+    key = (start, stop, num_points, is_log)
+    grid = _GRID_CACHE.get(key)
+    if grid is None:
+        if is_log:
+            grid = np.geomspace(start, stop, num_points)
+        else:
+            grid = np.linspace(start, stop, num_points)
+        _GRID_CACHE[key] = grid
+    return grid
+
+
+class _SweepSignals(QObject):
+    """Signals for _SweepWorker; QRunnable cannot carry its own."""
+    
+    finished = Signal(dict)
+    failed = Signal(str)
+
+
+class _SweepWorker(QRunnable):
+    """
+    Runs the gain and noise sweeps on the global thread pool so a long
+    sweep never blocks the event loop; results come back via signals
+    and are plotted on the GUI thread.
+    """
+    
+    def __init__(self, chain, params):
+        super().__init__()
+        self.signals = _SweepSignals()
+        self._chain = chain
+        self._params = params
+    
+    def run(self):
+        try:
+            p = self._params
+            chain = self._chain
+            
+            # Calculate gain data; geomspace avoids the log10/10** round
+            # trip of the old logspace call and the grids are cached
+            freq_data = _freq_grid(p['gain_start'], p['gain_stop'],
+                                   p['num_points'], p['is_log'])
+            
+            gain_data = chain.total_gain_vectorized(freq_data)
+            
+            # Calculate noise data
+            spectral_freq_data = _freq_grid(p['start_spectral'],
+                                            p['stop_spectral'],
+                                            p['num_points'], p['is_log'])
+            
+            if p['show_contributions']:
+                noise_data, contributions_data = chain.noise_at_point_vec(
+                    len(chain) - 1, p['carrier_freq'], spectral_freq_data,
+                    contributions=True
+                )
+            else:
+                noise_data = chain.output_noise_vec(p['carrier_freq'],
+                                                    spectral_freq_data)
+                contributions_data = None
+            
+            self.signals.finished.emit({
+                'freq_data': freq_data,
+                'gain_data': gain_data,
+                'spectral_freq_data': spectral_freq_data,
+                'noise_data': noise_data,
+                'contributions_data': contributions_data,
+                'carrier_freq': p['carrier_freq'],
+                'is_log': p['is_log'],
+                'show_contributions': p['show_contributions'],
+            })
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class ResultsPanel(QWidget):
@@ -32,6 +147,21 @@ class ResultsPanel(QWidget):
         self.noise_data = None
         self.contributions_data = None
         
+        # persistent plot artists, reused across recalculations; the
+        # signature records the layout they were built for
+        self._plot_sig = None
+        self._gain_line = None
+        self._noise_line = None
+        self._contrib_lines = {}
+        
+        self._initialized = False
+        self._last_sig = None
+        self._pending_sig = None
+        # keep the in-flight worker referenced until its signals have
+        # been delivered; autoDelete may otherwise destroy the sender
+        # before the queued emission reaches the GUI thread (same
+        # keep-alive io_jobs uses for save jobs)
+        self._sweep_worker = None
         self._setup_ui()
         
     def _setup_ui(self):
@@ -110,9 +240,9 @@ class ResultsPanel(QWidget):
         left_layout.addWidget(param_group)
         
         # Buttons in left column
-        calc_button = QPushButton("Calculate && Plot Both")
-        calc_button.clicked.connect(self.calculate_and_plot)
-        left_layout.addWidget(calc_button)
+        self.calc_button = QPushButton("Calculate && Plot Both")
+        self.calc_button.clicked.connect(self.calculate_and_plot)
+        left_layout.addWidget(self.calc_button)
         
         export_button = QPushButton("Export Data (CSV)")
         export_button.clicked.connect(self._export_data)
@@ -138,7 +268,14 @@ class ResultsPanel(QWidget):
         right_layout = QVBoxLayout(right_widget)
         right_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Matplotlib figure with two subplots
+        # Matplotlib figure with two subplots; the import is deferred
+        # to first construction so this module stays cheap to import
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from matplotlib.backends.backend_qt5agg import (
+            FigureCanvasQTAgg, NavigationToolbar2QT)
+        from matplotlib.figure import Figure
+        
         self.figure = Figure(figsize=(10, 8))
         self.canvas = FigureCanvasQTAgg(self.figure)
         self.toolbar = NavigationToolbar2QT(self.canvas, self)
@@ -150,146 +287,189 @@ class ResultsPanel(QWidget):
         main_layout.addWidget(left_widget)
         main_layout.addWidget(right_widget)
         
-        # Show empty state initially
-        self._show_empty_state()
+    def showEvent(self, event):
+        """Draw the initial canvas content only once the panel is shown.
+        
+        The first matplotlib draw is deferred to the next event-loop tick
+        so the widget paints immediately instead of blocking on it.
+        """
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            QTimer.singleShot(0, self._show_empty_state)
         
     def set_chain(self, chain):
         """Set the signal chain to analyze."""
         self.chain = chain
         
     def calculate_and_plot(self):
-        """Calculate both gain and noise analyses and plot results."""
+        """Kick off both analyses on the thread pool and plot on return."""
         if self.chain is None or len(self.chain.components) == 0:
             self._show_empty_state()
             return
-            
-        try:
-            # Get parameters
-            gain_start = self.gain_start_freq_spin.value() * 1e9
-            gain_stop = self.gain_stop_freq_spin.value() * 1e9
-            carrier_freq = self.carrier_freq_spin.value() * 1e9
-            start_spectral = self.start_spectral_spin.value() * 1e3
-            stop_spectral = self.stop_spectral_spin.value() * 1e3
-            num_points = self.num_points_spin.value()
-            is_log = self.spacing_combo.currentText() == "Logarithmic"
-            show_contributions = self.show_contributions_check.isChecked()
-            
-            # Validate parameters
-            if gain_start >= gain_stop:
-                QMessageBox.warning(self, "Invalid Range", 
-                                  "Gain start frequency must be less than stop frequency.")
-                return
-            if start_spectral >= stop_spectral:
-                QMessageBox.warning(self, "Invalid Range", 
-                                  "Noise start offset must be less than stop offset.")
-                return
-            
-            # Calculate gain data
-            if is_log:
-                self.freq_data = np.logspace(np.log10(gain_start), np.log10(gain_stop), num_points)
-            else:
-                self.freq_data = np.linspace(gain_start, gain_stop, num_points)
-            
-            self.gain_data = np.array([self.chain.total_gain(f) for f in self.freq_data])
-            
-            # Calculate noise data
-            if is_log:
-                self.spectral_freq_data = np.logspace(np.log10(start_spectral), 
-                                                     np.log10(stop_spectral), num_points)
-            else:
-                self.spectral_freq_data = np.linspace(start_spectral, stop_spectral, num_points)
-            
-            if show_contributions:
-                self.noise_data = []
-                self.contributions_data = {}
-                
-                for spectral_freq in self.spectral_freq_data:
-                    total_noise, contributions = self.chain.noise_at_point(
-                        len(self.chain) - 1, carrier_freq, spectral_freq, contributions=True
-                    )
-                    self.noise_data.append(total_noise)
-                    
-                    for label, noise_val in contributions.items():
-                        if label not in self.contributions_data:
-                            self.contributions_data[label] = []
-                        self.contributions_data[label].append(noise_val)
-                
-                self.noise_data = np.array(self.noise_data)
-            else:
-                self.noise_data = np.array([
-                    self.chain.output_noise(carrier_freq, f) 
-                    for f in self.spectral_freq_data
-                ])
-                self.contributions_data = None
-            
-            # Plot both
-            self.figure.clear()
-            
-            # Gain plot (top)
-            ax1 = self.figure.add_subplot(2, 1, 1)
-            if is_log:
-                ax1.semilogx(self.freq_data / 1e9, self.gain_data, 'b-', linewidth=2)
-            else:
-                ax1.plot(self.freq_data / 1e9, self.gain_data, 'b-', linewidth=2)
-            
-            ax1.grid(True, alpha=0.3)
-            ax1.set_xlabel('Frequency (GHz)', fontsize=11)
-            ax1.set_ylabel('Total Gain (dB)', fontsize=11)
-            ax1.set_title(f'System Gain vs Frequency: {self.chain.name}', 
-                         fontsize=12, fontweight='bold')
-            
-            # Noise plot (bottom)
-            ax2 = self.figure.add_subplot(2, 1, 2)
-            if is_log:
-                ax2.loglog(self.spectral_freq_data / 1e3, self.noise_data, 
-                         'b-', linewidth=2, label='Total Noise')
-            else:
-                ax2.semilogy(self.spectral_freq_data / 1e3, self.noise_data, 
-                           'b-', linewidth=2, label='Total Noise')
-            
-            # Plot individual contributions if requested
-            if show_contributions and self.contributions_data:
-                for label, noise_vals in self.contributions_data.items():
-                    if is_log:
-                        ax2.loglog(self.spectral_freq_data / 1e3, noise_vals, 
-                                 '--', alpha=0.6, linewidth=1.5, label=label)
-                    else:
-                        ax2.semilogy(self.spectral_freq_data / 1e3, noise_vals, 
-                                   '--', alpha=0.6, linewidth=1.5, label=label)
-                ax2.legend(fontsize=8, loc='best')
-            
-            ax2.grid(True, alpha=0.3)
-            ax2.set_xlabel('Offset Frequency (kHz)', fontsize=11)
-            ax2.set_ylabel('Noise PSD (W/Hz)', fontsize=11)
-            ax2.set_title(f'Output Noise Spectrum at {carrier_freq/1e9:.2f} GHz Carrier', 
-                        fontsize=12, fontweight='bold')
-            
-            self.figure.tight_layout()
-            self.canvas.draw()
-            
-            # Update results summary
-            min_gain = np.min(self.gain_data)
-            max_gain = np.max(self.gain_data)
-            min_freq = self.freq_data[np.argmin(self.gain_data)] / 1e9
-            max_freq = self.freq_data[np.argmax(self.gain_data)] / 1e9
-            
-            min_noise = np.min(self.noise_data)
-            max_noise = np.max(self.noise_data)
-            avg_noise = np.mean(self.noise_data)
-            
-            results_text = (f"<b>Gain:</b> Min={min_gain:.2f} dB @ {min_freq:.3f} GHz  |  "
-                          f"Max={max_gain:.2f} dB @ {max_freq:.3f} GHz<br>"
-                          f"<b>Noise:</b> Min={min_noise:.2e} W/Hz  |  "
-                          f"Max={max_noise:.2e} W/Hz  |  Avg={avg_noise:.2e} W/Hz")
-            self.results_label.setText(results_text)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Calculation Error", 
-                               f"Failed to calculate results:\n{str(e)}")
+        
+        # Get parameters
+        gain_start = self.gain_start_freq_spin.value() * 1e9
+        gain_stop = self.gain_stop_freq_spin.value() * 1e9
+        carrier_freq = self.carrier_freq_spin.value() * 1e9
+        start_spectral = self.start_spectral_spin.value() * 1e3
+        stop_spectral = self.stop_spectral_spin.value() * 1e3
+        num_points = self.num_points_spin.value()
+        is_log = self.spacing_combo.currentText() == "Logarithmic"
+        show_contributions = self.show_contributions_check.isChecked()
+        
+        # Validate parameters
+        if gain_start >= gain_stop:
+            QMessageBox.warning(self, "Invalid Range", 
+                              "Gain start frequency must be less than stop frequency.")
+            return
+        if start_spectral >= stop_spectral:
+            QMessageBox.warning(self, "Invalid Range", 
+                              "Noise start offset must be less than stop offset.")
+            return
+        
+        # Identical chain and parameters as the last run? The plots
+        # and summary are already current -- skip the recompute.
+        calc_sig = (id(self.chain),
+                    tuple(id(c) for c in self.chain.components),
+                    gain_start, gain_stop, carrier_freq, start_spectral,
+                    stop_spectral, num_points, is_log, show_contributions)
+        if calc_sig == self._last_sig:
+            return
+        
+        # Hand the sweep to the thread pool; the UI stays responsive and
+        # _on_sweep_done picks the results up on the GUI thread.
+        self._pending_sig = calc_sig
+        self.calc_button.setEnabled(False)
+        self.results_label.setText("Calculating\u2026")
+        
+        worker = _SweepWorker(self.chain, {
+            'gain_start': gain_start,
+            'gain_stop': gain_stop,
+            'carrier_freq': carrier_freq,
+            'start_spectral': start_spectral,
+            'stop_spectral': stop_spectral,
+            'num_points': num_points,
+            'is_log': is_log,
+            'show_contributions': show_contributions,
+        })
+        worker.signals.finished.connect(self._on_sweep_done)
+        worker.signals.failed.connect(self._on_sweep_failed)
+        worker.setAutoDelete(False)
+        self._sweep_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_sweep_done(self, results):
+        """Plot the finished sweep; runs on the GUI thread."""
+        self.freq_data = results['freq_data']
+        self.gain_data = results['gain_data']
+        self.spectral_freq_data = results['spectral_freq_data']
+        self.noise_data = results['noise_data']
+        self.contributions_data = results['contributions_data']
+        carrier_freq = results['carrier_freq']
+        is_log = results['is_log']
+        show_contributions = results['show_contributions']
+        
+        # Plot both: rebuild the axes/artists only when the layout
+        # changed, otherwise just push new data into the existing lines
+        contrib_labels = (tuple(self.contributions_data)
+                          if (show_contributions and self.contributions_data)
+                          else ())
+        plot_sig = (is_log, contrib_labels)
+        if plot_sig != self._plot_sig:
+            self._build_plots(is_log, contrib_labels)
+            self._plot_sig = plot_sig
+        
+        ax1, ax2 = self.figure.axes
+        self._gain_line.set_data(*_draw_data(self.freq_data / 1e9, self.gain_data))
+        self._noise_line.set_data(*_draw_data(self.spectral_freq_data / 1e3,
+                                              self.noise_data))
+        for label in contrib_labels:
+            self._contrib_lines[label].set_data(
+                *_draw_data(self.spectral_freq_data / 1e3,
+                            self.contributions_data[label]))
+        
+        ax1.set_title(f'System Gain vs Frequency: {self.chain.name}', 
+                     fontsize=12, fontweight='bold')
+        ax2.set_title(f'Output Noise Spectrum at {carrier_freq/1e9:.2f} GHz Carrier', 
+                    fontsize=12, fontweight='bold')
+        for ax in (ax1, ax2):
+            ax.relim()
+            ax.autoscale_view()
+        self.canvas.draw_idle()
+        
+        # Update results summary
+        min_gain = np.min(self.gain_data)
+        max_gain = np.max(self.gain_data)
+        min_freq = self.freq_data[np.argmin(self.gain_data)] / 1e9
+        max_freq = self.freq_data[np.argmax(self.gain_data)] / 1e9
+        
+        min_noise = np.min(self.noise_data)
+        max_noise = np.max(self.noise_data)
+        avg_noise = np.mean(self.noise_data)
+        
+        results_text = (f"<b>Gain:</b> Min={min_gain:.2f} dB @ {min_freq:.3f} GHz  |  "
+                      f"Max={max_gain:.2f} dB @ {max_freq:.3f} GHz<br>"
+                      f"<b>Noise:</b> Min={min_noise:.2e} W/Hz  |  "
+                      f"Max={max_noise:.2e} W/Hz  |  Avg={avg_noise:.2e} W/Hz")
+        self.results_label.setText(results_text)
+        self._last_sig = self._pending_sig
+        self._sweep_worker = None
+        self.calc_button.setEnabled(True)
+    
+    def _on_sweep_failed(self, message):
+        """Report a sweep failure and re-arm the button."""
+        self._sweep_worker = None
+        self.calc_button.setEnabled(True)
+        self.results_label.setText("")
+        QMessageBox.critical(self, "Calculation Error", 
+                           f"Failed to calculate results:\n{message}")
+    
+    def _build_plots(self, is_log, contrib_labels):
+        """Create the two axes and their persistent line artists."""
+        self.figure.clear()
+        self._contrib_lines = {}
+        
+        # Axis scales are set once on the axes; every line is then a
+        # plain ax.plot, so there is one artist-construction path
+        # instead of loglog/semilogy branches per line
+        xscale = 'log' if is_log else 'linear'
+        
+        # Gain plot (top)
+        ax1 = self.figure.add_subplot(2, 1, 1)
+        ax1.set_xscale(xscale)
+        (self._gain_line,) = ax1.plot([], [], 'b-', linewidth=2)
+        
+        ax1.grid(True, alpha=0.3)
+        ax1.set_xlabel('Frequency (GHz)', fontsize=11)
+        ax1.set_ylabel('Total Gain (dB)', fontsize=11)
+        
+        # Noise plot (bottom)
+        ax2 = self.figure.add_subplot(2, 1, 2)
+        ax2.set_xscale(xscale)
+        ax2.set_yscale('log')
+        (self._noise_line,) = ax2.plot([], [], 'b-', linewidth=2, 
+                                       label='Total Noise')
+        
+        # One dashed line per individual contribution, if requested
+        for label in contrib_labels:
+            (line,) = ax2.plot([], [], '--', alpha=0.6, linewidth=1.5, 
+                               label=label)
+            self._contrib_lines[label] = line
+        if contrib_labels:
+            ax2.legend(fontsize=8, loc='best')
+        
+        ax2.grid(True, alpha=0.3)
+        ax2.set_xlabel('Offset Frequency (kHz)', fontsize=11)
+        ax2.set_ylabel('Noise PSD (W/Hz)', fontsize=11)
+        
+        self.figure.tight_layout()
     
     def _show_empty_state(self):
         """Show empty state message."""
         self.figure.clear()
+        self._plot_sig = None
+        self._last_sig = None
         ax = self.figure.add_subplot(111)
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
@@ -311,14 +491,20 @@ class ResultsPanel(QWidget):
         )
         
         if gain_file:
-            try:
-                with open(gain_file, 'w') as f:
-                    f.write("Frequency_Hz,Frequency_GHz,Gain_dB\n")
-                    for freq, gain in zip(self.freq_data, self.gain_data):
-                        f.write(f"{freq},{freq/1e9},{gain}\n")
-                QMessageBox.information(self, "Success", f"Gain data exported to:\n{gain_file}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Failed to export gain data:\n{str(e)}")
+            # np.savetxt formats the whole table in C instead of one
+            # Python f-string per row; the write runs on the thread pool
+            submit_save(
+                self,
+                functools.partial(
+                    np.savetxt, gain_file,
+                    np.column_stack((self.freq_data,
+                                     self.freq_data / 1e9,
+                                     self.gain_data)),
+                    fmt='%.9e', delimiter=',',
+                    header='Frequency_Hz,Frequency_GHz,Gain_dB',
+                    comments=''),
+                f"Gain data exported to:\n{gain_file}",
+                "Export Error")
         
         # Export noise data
         noise_file, _ = QFileDialog.getSaveFileName(
@@ -326,24 +512,25 @@ class ResultsPanel(QWidget):
         )
         
         if noise_file:
-            try:
-                with open(noise_file, 'w') as f:
-                    header = "Spectral_Freq_Hz,Spectral_Freq_kHz,Total_Noise_W_per_Hz"
-                    if self.contributions_data:
-                        for label in self.contributions_data.keys():
-                            header += f",{label}_W_per_Hz"
-                    f.write(header + "\n")
-                    
-                    for i, (spectral_freq, noise) in enumerate(zip(self.spectral_freq_data, self.noise_data)):
-                        row = f"{spectral_freq},{spectral_freq/1e3},{noise}"
-                        if self.contributions_data:
-                            for label in self.contributions_data.keys():
-                                row += f",{self.contributions_data[label][i]}"
-                        f.write(row + "\n")
-                
-                QMessageBox.information(self, "Success", f"Noise data exported to:\n{noise_file}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Failed to export noise data:\n{str(e)}")
+            # stack every column once and let np.savetxt format the
+            # whole table in C, same as the gain export above
+            header = ["Spectral_Freq_Hz", "Spectral_Freq_kHz", "Total_Noise_W_per_Hz"]
+            columns = [self.spectral_freq_data,
+                       self.spectral_freq_data / 1e3,
+                       self.noise_data]
+            if self.contributions_data:
+                for label, values in self.contributions_data.items():
+                    header.append(f"{label}_W_per_Hz")
+                    columns.append(np.asarray(values))
+            
+            submit_save(
+                self,
+                functools.partial(np.savetxt, noise_file,
+                                  np.column_stack(columns),
+                                  fmt='%.9e', delimiter=',',
+                                  header=",".join(header), comments=''),
+                f"Noise data exported to:\n{noise_file}",
+                "Export Error")
     
     def _save_plots(self):
         """Save the current plots."""
@@ -360,7 +547,25 @@ class ResultsPanel(QWidget):
             return
         
         try:
-            self.figure.savefig(file_path, dpi=300, bbox_inches='tight')
-            QMessageBox.information(self, "Success", f"Plots saved to:\n{file_path}")
+            # the figure is not thread-safe, so render to memory on the
+            # GUI thread; only the byte write goes to the thread pool.
+            # Vector formats carry no raster, so skip the dpi knob; for
+            # raster output 150 dpi is plenty for screen-sized figures
+            # and avoids the extra measuring render of bbox_inches
+            fmt = file_path.rsplit('.', 1)[-1].lower() if '.' in file_path else 'png'
+            buffer = io.BytesIO()
+            if fmt in ('pdf', 'svg'):
+                self.figure.savefig(buffer, format=fmt, bbox_inches='tight')
+            else:
+                self.figure.savefig(buffer, format=fmt, dpi=150)
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Failed to save plots:\n{str(e)}")
+            return
+        
+        data = buffer.getvalue()
+        
+        def _write():
+            with open(file_path, 'wb') as f:
+                f.write(data)
+        
+        submit_save(self, _write, f"Plots saved to:\n{file_path}", "Save Error")
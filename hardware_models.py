@@ -4,6 +4,7 @@ Each class contains functions for the gain and noise contribution of
 the component.
 """
 
+import functools
 import numpy as np
 import os
 import scipy.interpolate as interpolate
@@ -16,6 +17,40 @@ from utils import kb
 def exponential(f, A, n, b):
     return A*f**-n +b
 
+
+def _memoize_scalar(func):
+    """
+    Cache scalar-frequency lookups on gain/noise methods.
+
+    The hardware models are immutable after construction and are shared as
+    flyweights across chains, so an lru_cache keyed on (instance, freq)
+    collapses the repeated scalar interpolator calls made while walking a
+    chain. ndarray sweeps are unhashable and take the direct vectorized
+    path unchanged.
+    """
+    cached = functools.lru_cache(maxsize=256)(func)
+
+    @functools.wraps(func)
+    def wrapper(self, f):
+        if isinstance(f, np.ndarray):
+            return func(self, f)
+        return cached(self, float(f))
+
+    return wrapper
+
+
+@functools.cache
+def shared_model(cls, *args):
+    """
+    Build (or fetch) the shared flyweight instance of cls(*args).
+
+    Hardware models are stateless after construction -- pure functions of
+    frequency -- so every chain built with the same model class and
+    numeric arguments can share one instance, along with its parsed
+    transfer-function tables, instead of re-building splines per chain.
+    """
+    return cls(*args)
+
 class AD9082:
     # note: currently, the dac phase noise slope is simply taken as -10dbm/hz per decade
     # this is not quite what is in the datasheet, but it is much easier to fit with an exponential
@@ -66,6 +101,7 @@ class CryoElec_LNA:
         self.gain_f = interpolate.interp1d(self.f_datasheet, self.gain_datasheet, bounds_error=False)
 #         self.gain_f = interpolate.CubicSpline(self.f_datasheet, self.gain_datasheet)
         
+    @_memoize_scalar
     def gain(self, f):
         return self.gain_f(f)
 
@@ -87,10 +123,12 @@ class ZX60_3018Gplus:
         meas_gain = [23, 23.,   22.45, 21.6,  20.7, 20.1,  19.,   17.85, 17.8]
         self.meas_gain_func = interpolate.interp1d(meas_gainf, meas_gain, bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
 #         return self.gain_f(f)
         return self.meas_gain_func(f)                                           
     
+    @_memoize_scalar
     def noise(self, f):
         return self.noise_f(f)
 
@@ -117,6 +155,7 @@ class Attenuator:
         else:
             return self.attenuation * np.ones(len(carrier_freq))
     
+    @_memoize_scalar
     def gain_meas(self, carrier_freq):
         return self.atten_func(carrier_freq) + self.attenuation
     
@@ -142,6 +181,7 @@ class SMA_cables:
         self.gain_per_m = interpolate.interp1d(fdatasheet, db_per_m, bounds_error=False)
 
         
+    @_memoize_scalar
     def gain(self, f):
         return self.gain_per_m(f) * self.length
         
@@ -165,6 +205,7 @@ class SMA_CuNi_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, bounds_error=False)
         
+    @_memoize_scalar
     def gain(self, f):
         if self.temperature == 300:
             return self.warm_gain(f)
@@ -195,6 +236,7 @@ class SMA_CuNi086_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, bounds_error=False)
         
+    @_memoize_scalar
     def gain(self, f):
         if self.temperature > 100:
             return self.warm_gain(f)
@@ -218,6 +260,7 @@ class SMA_SS086_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         if self.temperature > 100:
             return self.warm_gain(f)
@@ -241,6 +284,7 @@ class SMA_SS219_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         if self.temperature > 100:
             return self.warm_gain(f)
@@ -265,6 +309,7 @@ class SMA_NbTi086_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         if self.temperature > 9:
             return self.warm_gain(f)
@@ -287,6 +332,7 @@ class SMA_FM_F141_cables:
         
         self.gain_per_m = interpolate.interp1d(fdatasheet, db_per_m, bounds_error=False)
         
+    @_memoize_scalar
     def gain(self, f):
         return self.gain_per_m(f) * self.length
 
@@ -305,9 +351,11 @@ class ASU_3GHz_LNA:
 #         self.gain_datasheet = np.asarray([0, 5.0, 28.0, 30.0, 31.0, 30.0, 32.0, 30.0, 26.0, 10.0])
         self.gain_f = interpolate.interp1d(self.f_datasheet, self.gain_datasheet, bounds_error=False)
         
+    @_memoize_scalar
     def gain(self, f):
         return self.gain_f(f)
     
+    @_memoize_scalar
     def noise(self, f):
         return self.noise(f)
 
@@ -324,6 +372,7 @@ class FilterHP_VHF1320p:
 
         self.gain_f = interpolate.interp1d(f_datasheet, gain_datasheet, bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, carrier_freq):
         return self.gain_f(carrier_freq)
 
@@ -340,6 +389,7 @@ class FilterHP_VHF1760p:
 
         self.gain_f = interpolate.interp1d(f_datasheet, gain_datasheet, bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, carrier_freq):
         return self.gain_f(carrier_freq)
 
@@ -356,6 +406,7 @@ class FilterHP_VHF1910p:
 
         self.gain_f = interpolate.interp1d(f_datasheet, gain_datasheet, bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, carrier_freq):
         return self.gain_f(carrier_freq)
 
@@ -384,6 +435,7 @@ class BCB029_SS034_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, fill_value='extrapolate', bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, fill_value='extrapolate', bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         """
         Return insertion loss (dB) at frequency f (Hz):
@@ -416,6 +468,7 @@ class BCB014_SS085_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, fill_value='extrapolate', bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, fill_value='extrapolate', bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         """
         Return insertion loss (dB) at frequency f (Hz):
@@ -446,6 +499,7 @@ class BCB024_SP034_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, fill_value='extrapolate', bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, fill_value='extrapolate', bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         if self.temperature > 100:
             return self.warm_gain(f)
@@ -472,6 +526,7 @@ class BCB012_NbTi034_cryo:
         self.warm_gain = interpolate.interp1d(fdatasheet, warmgain, fill_value='extrapolate', bounds_error=False)
         self.cold_gain = interpolate.interp1d(fdatasheet, coldgain, fill_value='extrapolate', bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         if self.temperature > 100:
             return self.warm_gain(f)
@@ -498,6 +553,7 @@ class SMA_RG58C_cables:
         # build per‐metre loss function and multiply by length in .gain()
         self.atten_per_m = interpolate.interp1d(fd, db_per_m, fill_value='extrapolate', bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         """
         Total insertion loss (dB) at frequency f (Hz) over self.length metres.
@@ -524,6 +580,7 @@ class SMA_RG174A_cables:
 
         self.atten_per_m = interpolate.interp1d(fd, db_per_m, fill_value='extrapolate', bounds_error=False)
 
+    @_memoize_scalar
     def gain(self, f):
         """
         Total insertion loss (dB) at frequency f (Hz) over self.length metres.
@@ -3,10 +3,34 @@ Signal chain class for managing ordered components and calculating
 gain and noise propagation through the chain.
 """
 
+import importlib.util
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from typing import List, Union, Tuple
 from utils import to_dbm, to_W, db_to_linear
 
+# chain_kernels imports numba and compiles/warms its kernels at import
+# time. This module sits on the GUI import path, so the kernels are
+# imported inside the vectorized methods on first use instead; GUI
+# startup never pays the compilation.
+
+# With numba the cascade kernel already uses every core; the process
+# pool below is only worth its pickling and startup cost without it,
+# and only for large offset grids. find_spec answers the question
+# without importing numba.
+_HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+_PARALLEL_MIN_POINTS = 4096
+
+
+def _noise_worker(chain_pickle, carrier_frequency, spectral_freqs):
+    # module-level so ProcessPoolExecutor can pickle it
+    chain = pickle.loads(chain_pickle)
+    return chain.output_noise_vec(carrier_frequency, spectral_freqs)
+
 
 class SignalChain:
     """
@@ -60,6 +84,53 @@ class SignalChain:
         
         return idx
     
+    def move_component(self, old_index, new_index):
+        """
+        Move a component to a new position in the chain.
+        
+        Updates the chain in place (O(N) list surgery) rather than
+        requiring callers to rebuild the whole chain; label indices are
+        remapped to follow the move.
+        
+        Parameters
+        ----------
+        old_index : int
+            Current index of the component
+        new_index : int
+            Index the component should end up at
+        """
+        component = self.components.pop(old_index)
+        self.components.insert(new_index, component)
+        
+        def shifted(idx):
+            if idx == old_index:
+                return new_index
+            if old_index < idx <= new_index:
+                return idx - 1
+            if new_index <= idx < old_index:
+                return idx + 1
+            return idx
+        
+        self.labels = {label: shifted(idx) for label, idx in self.labels.items()}
+    
+    def remove_component(self, index):
+        """
+        Remove the component at the given index in place.
+        
+        Parameters
+        ----------
+        index : int
+            Index of the component to remove
+        """
+        self.components.pop(index)
+        self.labels = {label: idx - (1 if idx > index else 0)
+                       for label, idx in self.labels.items() if idx != index}
+    
+    def clear(self):
+        """Remove every component from the chain."""
+        self.components.clear()
+        self.labels.clear()
+    
     def get_index(self, reference):
         """
         Get the index of a component from either an index or label.
@@ -217,6 +288,108 @@ class SignalChain:
             return 0.0
         return self.gain_between(0, len(self.components) - 1, frequency)
     
+    def total_gain_vectorized(self, freqs):
+        """
+        Calculate total gain through the entire chain for an array of
+        frequencies in one pass.
+        
+        Each component's gain is evaluated on the whole array at once and
+        the resulting (n_components, n_points) rows are summed with a
+        single NumPy reduction, instead of one full chain traversal per
+        frequency point. Components whose gain() only handles scalars are
+        adapted with np.vectorize.
+        
+        Parameters
+        ----------
+        freqs : np.ndarray
+            Frequencies in Hz
+            
+        Returns
+        -------
+        np.ndarray
+            Total gain in dB at each frequency
+        """
+        freqs = np.asarray(freqs, dtype=float)
+        rows = self._gain_rows(freqs)
+        if rows.ndim == 2:
+            from chain_kernels import sum_gain_rows
+            return sum_gain_rows(rows)
+        return rows.sum(axis=0)
+    
+    def _gain_rows(self, freqs):
+        """
+        Evaluate every component's gain over a frequency array.
+        
+        Returns a (n_components, n_points) array; components without a
+        gain method contribute zero rows, so row index matches chain
+        index and suffix sums give stage-to-output gains directly.
+        """
+        rows = np.zeros((len(self.components),) + freqs.shape)
+        for i, component in enumerate(self.components):
+            if not hasattr(component, 'gain'):
+                continue
+            try:
+                row = np.asarray(component.gain(freqs), dtype=float)
+                if row.shape != freqs.shape:
+                    # gain() ignored the array (e.g. returned a constant);
+                    # broadcast rather than silently mis-shaping the row
+                    row = np.broadcast_to(row, freqs.shape)
+            except (TypeError, ValueError):
+                # scalar-only gain(); fall back to a per-point adapter
+                row = np.vectorize(component.gain)(freqs)
+            rows[i] = row
+        
+        return rows
+    
+    def output_noise_carrier_vec(self, carrier_freqs, spectral_frequency, gain_rows=None):
+        """
+        Vectorized output noise over an array of carrier frequencies at
+        one fixed spectral offset.
+        
+        The per-component gain rows are evaluated once and suffix-summed
+        to get every stage-to-output gain in a single reduction, instead
+        of re-walking the chain per carrier point.
+        
+        Parameters
+        ----------
+        carrier_freqs : np.ndarray
+            Carrier frequencies in Hz
+        spectral_frequency : float
+            Spectral/offset frequency in Hz
+        gain_rows : np.ndarray, optional
+            Precomputed _gain_rows(carrier_freqs); callers that also
+            need the total gain on the same grid can pass the rows in
+            to avoid re-evaluating every component
+            
+        Returns
+        -------
+        np.ndarray
+            Total output noise power spectral density in W/Hz
+        """
+        carrier_freqs = np.asarray(carrier_freqs, dtype=float)
+        if len(self.components) == 0:
+            return np.zeros(carrier_freqs.shape)
+        
+        rows = gain_rows if gain_rows is not None else self._gain_rows(carrier_freqs)
+        # suffix[i] = summed gain of stages i..end, i.e. stage-to-output
+        suffix = np.cumsum(rows[::-1], axis=0)[::-1]
+        
+        total_noise_W = np.zeros(carrier_freqs.shape)
+        for idx, component in enumerate(self.components):
+            if not hasattr(component, 'noise'):
+                continue
+            try:
+                noise_power = component.noise(spectral_frequency)
+            except TypeError:
+                try:
+                    noise_power = component.noise()
+                except Exception:
+                    continue
+            if noise_power > 0:
+                total_noise_W += noise_power * db_to_linear(suffix[idx])
+        
+        return total_noise_W
+    
     def output_noise(self, carrier_frequency, spectral_frequency):
         """
         Calculate total noise at the output of the chain.
@@ -237,19 +410,185 @@ class SignalChain:
             return 0.0
         return self.noise_at_point(len(self.components) - 1, carrier_frequency, spectral_frequency)
     
-    def summary(self):
+    def noise_at_point_vec(self, reference_point, carrier_frequency, spectral_freqs, contributions=False):
         """
-        Print a summary of the signal chain.
+        Vectorized noise_at_point over a whole array of offset frequencies.
+        
+        Each component's intrinsic noise is evaluated once on the full
+        offset grid and propagated with a single array multiply, instead
+        of one noise_at_point call per grid point.
+        
+        Parameters
+        ----------
+        reference_point : int or str
+            The point in the chain to calculate noise at
+        carrier_frequency : float
+            Carrier frequency in Hz (used for gain calculations)
+        spectral_freqs : np.ndarray
+            Spectral/offset frequencies in Hz
+        contributions : bool, optional
+            If True, also return a dict mapping labels to contribution arrays
+            
+        Returns
+        -------
+        np.ndarray
+            Total noise power spectral density in W/Hz, one per offset
+        dict (if contributions=True)
+            Dictionary mapping component labels to contribution ndarrays
         """
-        print(f"Signal Chain: {self.name}")
-        print(f"Total components: {len(self.components)}")
-        print("\nComponent List:")
-        print("-" * 60)
+        ref_idx = self.get_index(reference_point)
+        spectral_freqs = np.asarray(spectral_freqs, dtype=float)
+        
+        # Gather the per-stage intrinsic noise rows and stage-to-output
+        # gains as struct-of-arrays, then hand the whole cascade to one
+        # kernel call instead of accumulating stage by stage
+        stage_indices = []
+        stage_gains = []
+        stage_noise = []
+        
+        for idx in range(ref_idx + 1):
+            component = self.components[idx]
+            if not hasattr(component, 'noise'):
+                continue
+            
+            # Intrinsic noise on the whole offset grid; mirror the
+            # fallbacks of the scalar path for constant or scalar-only
+            # noise models
+            try:
+                noise_power = np.asarray(component.noise(spectral_freqs), dtype=float)
+                if noise_power.shape != spectral_freqs.shape:
+                    noise_power = np.broadcast_to(noise_power, spectral_freqs.shape)
+            except (TypeError, ValueError):
+                try:
+                    noise_power = np.vectorize(component.noise)(spectral_freqs)
+                except TypeError:
+                    try:
+                        noise_power = np.broadcast_to(float(component.noise()),
+                                                      spectral_freqs.shape)
+                    except Exception:
+                        continue
+            
+            if not np.any(noise_power > 0):
+                continue
+            
+            # The stage-to-output gain is evaluated at the carrier and
+            # does not depend on the offset: one scalar per stage
+            gain_db = self.gain_between(idx, ref_idx, carrier_frequency)
+            stage_indices.append(idx)
+            stage_gains.append(db_to_linear(gain_db))
+            stage_noise.append(noise_power)
+        
+        if not stage_noise:
+            total_noise_W = np.zeros(spectral_freqs.shape)
+            if contributions:
+                return total_noise_W, {}
+            return total_noise_W
+        
+        gain_lin = np.asarray(stage_gains, dtype=float)
+        noise_psd = np.asarray(stage_noise, dtype=float)
+        from chain_kernels import cascade_output_noise
+        total_noise_W = cascade_output_noise(gain_lin, noise_psd)
+        
+        if contributions:
+            noise_dict = {
+                self._get_label_for_index(idx):
+                    np.where(noise_psd[k] > 0, noise_psd[k] * gain_lin[k], 0.0)
+                for k, idx in enumerate(stage_indices)
+            }
+            return total_noise_W, noise_dict
+        return total_noise_W
+    
+    def output_noise_vec(self, carrier_frequency, spectral_freqs):
+        """
+        Vectorized output_noise over an array of offset frequencies.
+        
+        Parameters
+        ----------
+        carrier_frequency : float
+            Carrier frequency in Hz
+        spectral_freqs : np.ndarray
+            Spectral/offset frequencies in Hz
+            
+        Returns
+        -------
+        np.ndarray
+            Total output noise power spectral density in W/Hz
+        """
+        spectral_freqs = np.asarray(spectral_freqs, dtype=float)
+        if len(self.components) == 0:
+            return np.zeros(spectral_freqs.shape)
+        return self.noise_at_point_vec(len(self.components) - 1,
+                                       carrier_frequency, spectral_freqs)
+    
+    def output_noise_parallel(self, carrier_frequency, spectral_freqs):
+        """
+        output_noise_vec sharded across a process pool.
+        
+        Falls through to the plain vectorized path whenever the pool
+        cannot win: numba is installed (its kernel already parallelizes
+        over offsets), the grid is small, or the chain does not pickle.
+        
+        Parameters
+        ----------
+        carrier_frequency : float
+            Carrier frequency in Hz
+        spectral_freqs : np.ndarray
+            Spectral/offset frequencies in Hz
+            
+        Returns
+        -------
+        np.ndarray
+            Total output noise power spectral density in W/Hz
+        """
+        spectral_freqs = np.asarray(spectral_freqs, dtype=float)
+        if (_HAVE_NUMBA or len(self.components) == 0
+                or spectral_freqs.size < _PARALLEL_MIN_POINTS):
+            return self.output_noise_vec(carrier_frequency, spectral_freqs)
+        
+        try:
+            payload = pickle.dumps(self)
+        except Exception:
+            return self.output_noise_vec(carrier_frequency, spectral_freqs)
+        
+        n_workers = os.cpu_count() or 1
+        chunks = np.array_split(spectral_freqs, n_workers)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            parts = executor.map(_noise_worker,
+                                 [payload] * len(chunks),
+                                 [carrier_frequency] * len(chunks),
+                                 chunks)
+        return np.concatenate(list(parts))
+    
+    def summary_text(self):
+        """
+        Build the chain summary as a single string.
+        
+        Assembling the lines once and joining means callers that both
+        display and save the summary do not walk the chain twice.
+        
+        Returns
+        -------
+        str
+            Multi-line summary of the chain and its components
+        """
+        lines = [
+            f"Signal Chain: {self.name}",
+            f"Total components: {len(self.components)}",
+            "",
+            "Component List:",
+            "-" * 60,
+        ]
         for idx, component in enumerate(self.components):
             label = self._get_label_for_index(idx)
-            comp_type = getattr(component, 'component_type', 'unknown')
-            print(f"  [{idx:2d}] {label:30s} ({component.__class__.__name__})")
-        print("-" * 60)
+            lines.append(f"  [{idx:2d}] {label:30s} ({component.__class__.__name__})")
+        lines.append("-" * 60)
+        return "\n".join(lines)
+    
+    def summary(self):
+        """
+        Print a summary of the signal chain.
+        """
+        print(self.summary_text())
     
     def __repr__(self):
         return f"SignalChain(name='{self.name}', components={len(self.components)})"